@@ -109,10 +109,11 @@ class ArchiveManager:
             return json.load(f)
 
     def save_state(self, state):
-        """保存 state.json（原子化写入）"""
+        """保存 state.json（原子化写入），返回写入的字节数"""
         # 使用集中式原子写入（自动备份）
-        atomic_write_json(self.state_file, state, use_lock=True, backup=True)
+        written_bytes = atomic_write_json(self.state_file, state, use_lock=True, backup=True)
         print(f"✅ state.json 已原子化更新")
+        return written_bytes
 
     def load_archive(self, archive_file):
         """加载归档文件"""
@@ -463,7 +464,7 @@ class ArchiveManager:
 
         # 从 state.json 中移除
         state = self.remove_from_state(state, inactive_chars, resolved_threads, old_reviews)
-        self.save_state(state)
+        written_bytes = self.save_state(state)
 
         # 最终统计
         print(f"\n✅ 归档完成:")
@@ -471,8 +472,8 @@ class ArchiveManager:
         print(f"   伏笔归档: {threads_archived} → {self.plot_threads_archive.name}")
         print(f"   报告归档: {reviews_archived} → {self.reviews_archive.name}")
 
-        # 显示归档后的文件大小
-        new_size_mb = self.state_file.stat().st_size / (1024 * 1024)
+        # 显示归档后的文件大小（直接使用写入字节数，无需再 stat）
+        new_size_mb = written_bytes / (1024 * 1024)
         saved_mb = trigger["file_size_mb"] - new_size_mb
         print(f"\n💾 文件大小: {trigger['file_size_mb']:.2f} MB → {new_size_mb:.2f} MB (节省 {saved_mb:.2f} MB)")
 
@@ -521,8 +522,11 @@ class ArchiveManager:
         # 计算归档文件大小
         total_size = 0
         for archive_file in [self.characters_archive, self.plot_threads_archive, self.reviews_archive]:
-            if archive_file.exists():
+            # 一次 stat 同时完成存在性判断与取大小
+            try:
                 total_size += archive_file.stat().st_size
+            except FileNotFoundError:
+                continue
 
         print(f"   归档大小: {total_size / 1024:.2f} KB")
 
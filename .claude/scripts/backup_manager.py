@@ -118,6 +118,9 @@ __pycache__/
 # Don't ignore .webnovel (we need to track state.json)
 # But ignore cache files
 .webnovel/context_cache.json
+# SQLite WAL sidecars (transient, only valid next to the live .db)
+.webnovel/*.db-wal
+.webnovel/*.db-shm
 """)
 
             # 初始提交
@@ -125,7 +125,7 @@ class EmbeddingAPIClient:
         base_delay = getattr(self.config, 'api_retry_delay', 1.0)
 
         async with self.sem:
-            start = time.time()
+            start = time.perf_counter()
             session = await self._get_session()
 
             for attempt in range(max_retries):
@@ -148,7 +148,7 @@ class EmbeddingAPIClient:
 
                             if embeddings:
                                 self.stats.total_calls += 1
-                                self.stats.total_time += time.time() - start
+                                self.stats.total_time += time.perf_counter() - start
                                 self._warmed_up = True
                                 self.last_error_status = None
                                 self.last_error_message = ""
@@ -324,7 +324,7 @@ class RerankAPIClient:
         base_delay = getattr(self.config, 'api_retry_delay', 1.0)
 
         async with self.sem:
-            start = time.time()
+            start = time.perf_counter()
             session = await self._get_session()
 
             for attempt in range(max_retries):
@@ -343,7 +343,7 @@ class RerankAPIClient:
                             data = await resp.json()
 
                             self.stats.total_calls += 1
-                            self.stats.total_time += time.time() - start
+                            self.stats.total_time += time.perf_counter() - start
                             self._warmed_up = True
 
                             return self._parse_response(data)
@@ -427,7 +427,7 @@ class ModalAPIClient:
     async def warmup(self):
         """预热 Embedding 和 Rerank 服务"""
         print("[WARMUP] Warming up Embed + Rerank...")
-        start = time.time()
+        start = time.perf_counter()
 
         tasks = [self._warmup_embed(), self._warmup_rerank()]
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -438,7 +438,7 @@ class ModalAPIClient:
             else:
                 print(f"  [OK] {name} ready")
 
-        print(f"[WARMUP] Done in {time.time() - start:.1f}s")
+        print(f"[WARMUP] Done in {time.perf_counter() - start:.1f}s")
 
     async def _warmup_embed(self):
         await self._embed_client.warmup()
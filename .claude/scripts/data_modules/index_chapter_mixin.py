@@ -16,11 +16,18 @@ class IndexChapterMixin:
         """添加/更新章节元数据"""
         with self._get_conn() as conn:
             cursor = conn.cursor()
+            # ON CONFLICT 原地更新（SQLite 3.24+），避免 REPLACE 的删除+重插
             cursor.execute(
                 """
-                INSERT OR REPLACE INTO chapters
+                INSERT INTO chapters
                 (chapter, title, location, word_count, characters, summary)
                 VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(chapter) DO UPDATE SET
+                    title = excluded.title,
+                    location = excluded.location,
+                    word_count = excluded.word_count,
+                    characters = excluded.characters,
+                    summary = excluded.summary
             """,
                 (
                     meta.chapter,
@@ -72,14 +79,14 @@ class IndexChapterMixin:
             # 先删除该章节旧场景
             cursor.execute("DELETE FROM scenes WHERE chapter = ?", (chapter,))
 
-            # 插入新场景
-            for scene in scenes:
-                cursor.execute(
-                    """
-                    INSERT INTO scenes
-                    (chapter, scene_index, start_line, end_line, location, summary, characters)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+            # 插入新场景（一次 executemany 批量写入）
+            cursor.executemany(
+                """
+                INSERT INTO scenes
+                (chapter, scene_index, start_line, end_line, location, summary, characters)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                [
                     (
                         scene.chapter,
                         scene.scene_index,
@@ -88,8 +95,10 @@ class IndexChapterMixin:
                         scene.location,
                         scene.summary,
                         json.dumps(scene.characters, ensure_ascii=False),
-                    ),
-                )
+                    )
+                    for scene in scenes
+                ],
+            )
 
             conn.commit()
 
@@ -149,32 +158,61 @@ class IndexChapterMixin:
             confidence: 置信度
             skip_if_exists: 如果为True，当记录已存在时跳过（避免覆盖已有mentions）
         """
-        with self._get_conn() as conn:
-            cursor = conn.cursor()
+        self.record_appearances(
+            chapter,
+            [{"id": entity_id, "mentions": mentions, "confidence": confidence}],
+            skip_if_exists=skip_if_exists,
+        )
 
-            if skip_if_exists:
-                # 先检查是否已存在
-                cursor.execute(
-                    "SELECT 1 FROM appearances WHERE entity_id = ? AND chapter = ?",
-                    (entity_id, chapter),
-                )
-                if cursor.fetchone():
-                    return  # 已存在，跳过
+    def record_appearances(
+        self,
+        chapter: int,
+        entities: List[Dict],
+        skip_if_exists: bool = False,
+    ) -> int:
+        """批量记录同一章节的实体出场（单连接 executemany）
 
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO appearances
+        Args:
+            chapter: 章节号
+            entities: [{"id", "mentions", "confidence"}, ...]，每条都按给定 id 写入（不做过滤）
+            skip_if_exists: 同 record_appearance
+
+        Returns:
+            提交写入的条目数
+        """
+        rows = [
+            (
+                e["id"],
+                chapter,
+                json.dumps(e.get("mentions", []), ensure_ascii=False),
+                e.get("confidence", 1.0),
+            )
+            for e in entities
+        ]
+        if not rows:
+            return 0
+
+        # 已存在时：skip_if_exists 直接跳过，否则原地更新（单条语句完成判断与写入）
+        if skip_if_exists:
+            on_conflict = "DO NOTHING"
+        else:
+            on_conflict = (
+                "DO UPDATE SET mentions = excluded.mentions, "
+                "confidence = excluded.confidence"
+            )
+
+        with self._get_conn() as conn:
+            conn.executemany(
+                f"""
+                INSERT INTO appearances
                 (entity_id, chapter, mentions, confidence)
                 VALUES (?, ?, ?, ?)
+                ON CONFLICT(entity_id, chapter) {on_conflict}
             """,
-                (
-                    entity_id,
-                    chapter,
-                    json.dumps(mentions, ensure_ascii=False),
-                    confidence,
-                ),
+                rows,
             )
             conn.commit()
+        return len(rows)
 
     def get_entity_appearances(self, entity_id: str, limit: int = None) -> List[Dict]:
         """获取实体出场记录"""
@@ -284,17 +322,11 @@ class IndexChapterMixin:
         self.add_scenes(chapter, scene_metas)
         stats["scenes"] = len(scene_metas)
 
-        # 写入出场记录
-        for entity in entities:
-            entity_id = entity.get("id")
-            if entity_id and entity_id != "NEW":
-                self.record_appearance(
-                    entity_id=entity_id,
-                    chapter=chapter,
-                    mentions=entity.get("mentions", []),
-                    confidence=entity.get("confidence", 1.0),
-                )
-                stats["appearances"] += 1
+        # 写入出场记录（整章一次提交；跳过无 id 与尚未建档的 "NEW" 实体）
+        stats["appearances"] = self.record_appearances(
+            chapter,
+            [e for e in entities if e.get("id") and e.get("id") != "NEW"],
+        )
 
         return stats
 
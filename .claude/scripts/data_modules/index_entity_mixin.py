@@ -9,7 +9,7 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 logger = logging.getLogger(__name__)
@@ -129,6 +129,25 @@ class IndexEntityMixin:
                 return self._row_to_dict(row, parse_json=["current_json"])
             return None
 
+    def get_entities_by_ids(self, entity_ids: List[str]) -> Dict[str, Dict]:
+        """批量获取实体（一次 IN 查询），返回 {entity_id: entity}，不存在的 ID 不出现在结果中"""
+        ids = list(dict.fromkeys(entity_ids))
+        if not ids:
+            return {}
+        result: Dict[str, Dict] = {}
+        with self._get_conn() as conn:
+            cursor = conn.cursor()
+            # 分批绑定，避免超出 SQLite 变量数上限（旧版本为 999）
+            for start in range(0, len(ids), 500):
+                batch = ids[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(
+                    f"SELECT * FROM entities WHERE id IN ({placeholders})", batch
+                )
+                for row in cursor.fetchall():
+                    result[row["id"]] = self._row_to_dict(row, parse_json=["current_json"])
+        return result
+
     def get_entities_by_type(
         self, entity_type: str, include_archived: bool = False
     ) -> List[Dict]:
@@ -273,6 +292,26 @@ class IndexEntityMixin:
             except sqlite3.IntegrityError:
                 return False
 
+    def register_aliases(self, rows: List[Tuple[str, str, str]]) -> int:
+        """
+        批量注册别名 (alias, entity_id, entity_type)
+
+        单个事务内 executemany 写入，已存在的别名自动忽略；返回新增数量
+        """
+        if not rows:
+            return 0
+        with self._get_conn() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO aliases (alias, entity_id, entity_type)
+                VALUES (?, ?, ?)
+            """,
+                rows,
+            )
+            conn.commit()
+            return conn.total_changes - before
+
     def get_entities_by_alias(self, alias: str) -> List[Dict]:
         """
         根据别名查找实体 (一对多)
@@ -438,6 +477,34 @@ class IndexEntityMixin:
                 conn.commit()
                 return True
 
+    def upsert_relationships(self, rels: List[RelationshipMeta]) -> int:
+        """
+        批量插入或更新关系
+
+        单个事务内 executemany，相同 (from, to, type) 原地更新 description 和 chapter；
+        返回写入（新增+更新）条数
+        """
+        if not rels:
+            return 0
+        with self._get_conn() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                """
+                INSERT INTO relationships
+                (from_entity, to_entity, type, description, chapter)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(from_entity, to_entity, type) DO UPDATE SET
+                    description = excluded.description,
+                    chapter = excluded.chapter
+            """,
+                [
+                    (rel.from_entity, rel.to_entity, rel.type, rel.description, rel.chapter)
+                    for rel in rels
+                ],
+            )
+            conn.commit()
+            return conn.total_changes - before
+
     def get_entity_relationships(
         self, entity_id: str, direction: str = "both"
     ) -> List[Dict]:
@@ -466,13 +533,16 @@ class IndexEntityMixin:
                     (entity_id,),
                 )
             else:  # both
+                # 拆成两路 UNION ALL：各自按 (实体, chapter) 索引有序扫描后归并，免去临时排序；
+                # 第二路排除自环关系，避免与第一路重复
                 cursor.execute(
                     """
-                    SELECT * FROM relationships
-                    WHERE from_entity = ? OR to_entity = ?
+                    SELECT * FROM relationships WHERE from_entity = ?
+                    UNION ALL
+                    SELECT * FROM relationships WHERE to_entity = ? AND from_entity != ?
                     ORDER BY chapter DESC
                 """,
-                    (entity_id, entity_id),
+                    (entity_id, entity_id, entity_id),
                 )
 
             return [dict(row) for row in cursor.fetchall()]
@@ -219,6 +219,10 @@ class IndexManager(IndexChapterMixin, IndexEntityMixin, IndexDebtMixin, IndexRea
         self.config.ensure_dirs()
 
         with self._get_conn() as conn:
+            # WAL 模式持久化在库文件中，只需初始化时设置一次；
+            # 读写互不阻塞，且提交时不再对整个库文件 fsync
+            conn.execute("PRAGMA journal_mode=WAL")
+
             cursor = conn.cursor()
 
             # 章节表
@@ -332,32 +336,41 @@ class IndexManager(IndexChapterMixin, IndexEntityMixin, IndexDebtMixin, IndexRea
             """)
 
             # v5.1 引入索引
+            # 按类型/层级过滤并按 last_appearance DESC 排序的列表查询走复合索引，免去排序；
+            # 旧的单列索引是其前缀，删除以减少写放大
+            cursor.execute("DROP INDEX IF EXISTS idx_entities_type")
+            cursor.execute("DROP INDEX IF EXISTS idx_entities_tier")
             cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_entities_type ON entities(type)"
+                "CREATE INDEX IF NOT EXISTS idx_entities_type_last ON entities(type, last_appearance)"
             )
             cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_entities_tier ON entities(tier)"
+                "CREATE INDEX IF NOT EXISTS idx_entities_tier_last ON entities(tier, last_appearance)"
             )
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_entities_protagonist ON entities(is_protagonist)"
             )
+            # (entity_id, alias) 覆盖"按实体取别名"查询，无需回表；
+            # 按 alias 查找直接走主键 (alias, entity_id, entity_type) 前缀。
+            # 旧的单列索引已被覆盖，删除以减少写放大
+            cursor.execute("DROP INDEX IF EXISTS idx_aliases_entity")
+            cursor.execute("DROP INDEX IF EXISTS idx_aliases_alias")
             cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_aliases_entity ON aliases(entity_id)"
-            )
-            cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_aliases_alias ON aliases(alias)"
+                "CREATE INDEX IF NOT EXISTS idx_aliases_entity_alias ON aliases(entity_id, alias)"
             )
+            cursor.execute("DROP INDEX IF EXISTS idx_state_changes_entity")
             cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_state_changes_entity ON state_changes(entity_id)"
+                "CREATE INDEX IF NOT EXISTS idx_state_changes_entity_chapter ON state_changes(entity_id, chapter)"
             )
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_state_changes_chapter ON state_changes(chapter)"
             )
+            cursor.execute("DROP INDEX IF EXISTS idx_relationships_from")
+            cursor.execute("DROP INDEX IF EXISTS idx_relationships_to")
             cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_relationships_from ON relationships(from_entity)"
+                "CREATE INDEX IF NOT EXISTS idx_relationships_from_chapter ON relationships(from_entity, chapter)"
             )
             cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_relationships_to ON relationships(to_entity)"
+                "CREATE INDEX IF NOT EXISTS idx_relationships_to_chapter ON relationships(to_entity, chapter)"
             )
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_relationships_chapter ON relationships(chapter)"
@@ -452,6 +465,13 @@ class IndexManager(IndexChapterMixin, IndexEntityMixin, IndexDebtMixin, IndexRea
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_chase_debt_due ON chase_debt(due_chapter)"
             )
+            # 按状态过滤并按到期章节排序的查询（待偿还/逾期列表）走复合索引，免去排序
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_override_contracts_status_due ON override_contracts(status, due_chapter)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_chase_debt_status_due ON chase_debt(status, due_chapter)"
+            )
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_debt_events_debt ON debt_events(debt_id)"
             )
@@ -575,6 +595,9 @@ class IndexManager(IndexChapterMixin, IndexEntityMixin, IndexDebtMixin, IndexRea
         """获取数据库连接"""
         conn = sqlite3.connect(str(self.config.index_db))
         conn.row_factory = sqlite3.Row
+        # 连接级 PRAGMA（每次连接需重新设置）：WAL 下 NORMAL 同步已足够安全
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
         try:
             yield conn
         finally:
@@ -147,77 +147,47 @@ class IndexObservabilityMixin:
     def get_stats(self) -> Dict[str, int]:
         """获取索引统计"""
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT COUNT(*) FROM chapters")
-            chapters = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM scenes")
-            scenes = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(DISTINCT entity_id) FROM appearances")
-            appearances = cursor.fetchone()[0]
-
-            cursor.execute("SELECT MAX(chapter) FROM chapters")
-            max_chapter = cursor.fetchone()[0] or 0
-
-            # v5.1 引入统计
-            cursor.execute("SELECT COUNT(*) FROM entities")
-            entities = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM entities WHERE is_archived = 0")
-            active_entities = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM aliases")
-            aliases = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM state_changes")
-            state_changes = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM relationships")
-            relationships = cursor.fetchone()[0]
-
-            # v5.3 引入统计
-            cursor.execute("SELECT COUNT(*) FROM override_contracts")
-            override_contracts = cursor.fetchone()[0]
-
-            cursor.execute(
-                "SELECT COUNT(*) FROM override_contracts WHERE status = 'pending'"
-            )
-            pending_overrides = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM chase_debt WHERE status = 'active'")
-            active_debts = cursor.fetchone()[0]
-
-            cursor.execute(
-                "SELECT COALESCE(SUM(current_amount), 0) FROM chase_debt WHERE status IN ('active', 'overdue')"
-            )
-            total_debt = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM chapter_reading_power")
-            reading_power_records = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM review_metrics")
-            review_metrics = cursor.fetchone()[0]
+            # 合并为一条语句（标量子查询），一次往返取回全部计数
+            row = conn.execute(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM chapters) AS chapters,
+                    (SELECT COUNT(*) FROM scenes) AS scenes,
+                    (SELECT COUNT(DISTINCT entity_id) FROM appearances) AS appearances,
+                    (SELECT COALESCE(MAX(chapter), 0) FROM chapters) AS max_chapter,
+                    (SELECT COUNT(*) FROM entities) AS entities,
+                    (SELECT COUNT(*) FROM entities WHERE is_archived = 0) AS active_entities,
+                    (SELECT COUNT(*) FROM aliases) AS aliases,
+                    (SELECT COUNT(*) FROM state_changes) AS state_changes,
+                    (SELECT COUNT(*) FROM relationships) AS relationships,
+                    (SELECT COUNT(*) FROM override_contracts) AS override_contracts,
+                    (SELECT COUNT(*) FROM override_contracts WHERE status = 'pending') AS pending_overrides,
+                    (SELECT COUNT(*) FROM chase_debt WHERE status = 'active') AS active_debts,
+                    (SELECT COALESCE(SUM(current_amount), 0) FROM chase_debt
+                        WHERE status IN ('active', 'overdue')) AS total_debt,
+                    (SELECT COUNT(*) FROM chapter_reading_power) AS reading_power_records,
+                    (SELECT COUNT(*) FROM review_metrics) AS review_metrics
+                """
+            ).fetchone()
 
             return {
-                "chapters": chapters,
-                "scenes": scenes,
-                "appearances": appearances,
-                "max_chapter": max_chapter,
+                "chapters": row["chapters"],
+                "scenes": row["scenes"],
+                "appearances": row["appearances"],
+                "max_chapter": row["max_chapter"],
                 # v5.1 引入
-                "entities": entities,
-                "active_entities": active_entities,
-                "aliases": aliases,
-                "state_changes": state_changes,
-                "relationships": relationships,
+                "entities": row["entities"],
+                "active_entities": row["active_entities"],
+                "aliases": row["aliases"],
+                "state_changes": row["state_changes"],
+                "relationships": row["relationships"],
                 # v5.3 引入
-                "override_contracts": override_contracts,
-                "pending_overrides": pending_overrides,
-                "active_debts": active_debts,
-                "total_debt": total_debt,
-                "reading_power_records": reading_power_records,
-                "review_metrics": review_metrics,
+                "override_contracts": row["override_contracts"],
+                "pending_overrides": row["pending_overrides"],
+                "active_debts": row["active_debts"],
+                "total_debt": row["total_debt"],
+                "reading_power_records": row["reading_power_records"],
+                "review_metrics": row["review_metrics"],
             }
 
 
@@ -134,6 +134,7 @@ def migrate_state_to_sqlite(
     if verbose:
         print(f"\n🔄 迁移 alias_index...")
 
+    alias_rows = []
     for alias, entries in alias_index.items():
         if not isinstance(entries, list):
             continue
@@ -148,16 +149,30 @@ def migrate_state_to_sqlite(
             if not entity_id or not entity_type:
                 stats["skipped"] += 1
                 continue
+            # 列表/字典无法绑定为 SQLite 参数，跳过以免拖垮整批；整数等标量照常写入
+            if isinstance(entity_id, (list, dict)) or isinstance(entity_type, (list, dict)):
+                stats["skipped"] += 1
+                continue
 
+            alias_rows.append((alias, entity_id, entity_type))
+
+    # 别名整批写入（单事务 executemany），避免逐条开连接提交；整批失败时逐条重试，按条计错
+    try:
+        if not dry_run:
+            sql_manager.register_aliases(alias_rows)
+        stats["aliases"] += len(alias_rows)
+
+    except Exception as e:
+        if verbose:
+            print(f"  ⚠️ 别名批量迁移失败，逐条重试: {e}")
+        for alias, entity_id, entity_type in alias_rows:
             try:
-                if not dry_run:
-                    sql_manager.register_alias(alias, entity_id, entity_type)
+                sql_manager.register_alias(alias, entity_id, entity_type)
                 stats["aliases"] += 1
-
-            except Exception as e:
+            except Exception as row_error:
                 stats["errors"] += 1
                 if verbose:
-                    print(f"  ⚠️ 别名迁移失败 {alias}: {e}")
+                    print(f"  ⚠️ 别名迁移失败 {alias}: {row_error}")
 
     if verbose:
         print(f"  ✅ 别名: {stats['aliases']} 个")
@@ -202,32 +217,44 @@ def migrate_state_to_sqlite(
     if verbose:
         print(f"\n🔄 迁移 structured_relationships...")
 
+    rel_rows = []
     for rel in relationships:
         if not isinstance(rel, dict):
             stats["skipped"] += 1
             continue
 
-        try:
-            from_entity = rel.get("from", rel.get("from_entity", ""))
-            to_entity = rel.get("to", rel.get("to_entity", ""))
-            if not from_entity or not to_entity:
-                stats["skipped"] += 1
-                continue
+        from_entity = rel.get("from", rel.get("from_entity", ""))
+        to_entity = rel.get("to", rel.get("to_entity", ""))
+        if not from_entity or not to_entity:
+            stats["skipped"] += 1
+            continue
 
-            if not dry_run:
-                sql_manager.upsert_relationship(
-                    from_entity=from_entity,
-                    to_entity=to_entity,
-                    type=rel.get("type", "相识"),
-                    description=rel.get("description", ""),
-                    chapter=rel.get("chapter", 0)
-                )
-            stats["relationships"] += 1
+        # 入批前逐条规整字段，避免单条脏数据（如 chapter: null）触发约束导致整批回滚
+        rel_rows.append({
+            "from_entity": from_entity,
+            "to_entity": to_entity,
+            "type": rel.get("type") or "相识",
+            "description": str(rel.get("description") or ""),
+            "chapter": _coerce_chapter(rel.get("chapter"))
+        })
 
-        except Exception as e:
-            stats["errors"] += 1
-            if verbose:
-                print(f"  ⚠️ 关系迁移失败: {e}")
+    # 关系整批写入（单事务 executemany + ON CONFLICT 原地更新）；整批失败时逐条重试，按条计错
+    try:
+        if not dry_run:
+            sql_manager.upsert_relationships(rel_rows)
+        stats["relationships"] += len(rel_rows)
+
+    except Exception as e:
+        if verbose:
+            print(f"  ⚠️ 关系批量迁移失败，逐条重试: {e}")
+        for row in rel_rows:
+            try:
+                sql_manager.upsert_relationship(**row)
+                stats["relationships"] += 1
+            except Exception as row_error:
+                stats["errors"] += 1
+                if verbose:
+                    print(f"  ⚠️ 关系迁移失败 {row['from_entity']} → {row['to_entity']}: {row_error}")
 
     if verbose:
         print(f"  ✅ 关系: {stats['relationships']} 条")
@@ -322,6 +349,14 @@ def _slim_relationships(relationships: Dict) -> Dict:
     return relationships
 
 
+def _coerce_chapter(value: Any) -> int:
+    """章节号规整为 int，缺失或无法解析时为 0"""
+    try:
+        return int(value) if value is not None else 0
+    except (TypeError, ValueError):
+        return 0
+
+
 def main():
     import argparse
     from .cli_output import print_success, print_error
@@ -75,6 +75,9 @@ class RAGAdapter:
         self.config.ensure_dirs()
 
         with self._get_conn() as conn:
+            # 与 index.db 一致：WAL 持久化在库文件中，初始化时设置一次
+            conn.execute("PRAGMA journal_mode=WAL")
+
             cursor = conn.cursor()
 
             def _table_columns(table_name: str) -> set[str]:
@@ -145,6 +148,8 @@ class RAGAdapter:
     def _get_conn(self):
         """获取数据库连接（确保关闭，避免 Windows 下文件句柄泄漏）"""
         conn = sqlite3.connect(str(self.config.vector_db))
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
         try:
             yield conn
         finally:
@@ -406,13 +411,14 @@ class RAGAdapter:
         # 计算词频
         tf_counter = Counter(tokens)
 
-        # 插入倒排索引
-        for term, count in tf_counter.items():
-            tf = count / doc_length if doc_length > 0 else 0
-            cursor.execute("""
-                INSERT INTO bm25_index (term, chunk_id, tf)
-                VALUES (?, ?, ?)
-            """, (term, chunk_id, tf))
+        # 插入倒排索引（一次 executemany 批量写入）
+        cursor.executemany("""
+            INSERT INTO bm25_index (term, chunk_id, tf)
+            VALUES (?, ?, ?)
+        """, [
+            (term, chunk_id, count / doc_length if doc_length > 0 else 0)
+            for term, count in tf_counter.items()
+        ])
 
         # 更新文档统计
         cursor.execute("""
@@ -13,7 +13,7 @@ SQL State Manager - SQLite 状态管理模块 (v5.4)
 """
 
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -187,6 +187,10 @@ class SQLStateManager:
         """注册别名"""
         return self._index_manager.register_alias(alias, entity_id, entity_type)
 
+    def register_aliases(self, rows: List[Tuple[str, str, str]]) -> int:
+        """批量注册别名 (alias, entity_id, entity_type)，返回新增数量"""
+        return self._index_manager.register_aliases(rows)
+
     # ==================== 状态变化操作 ====================
 
     def record_state_change(
@@ -249,6 +253,25 @@ class SQLStateManager:
         )
         return self._index_manager.upsert_relationship(rel)
 
+    def upsert_relationships(self, relationships: List[Dict[str, Any]]) -> int:
+        """
+        批量插入或更新关系
+
+        relationships: [{"from_entity", "to_entity", "type", "description", "chapter"}]
+        返回: 写入条数
+        """
+        rels = [
+            RelationshipMeta(
+                from_entity=rel["from_entity"],
+                to_entity=rel["to_entity"],
+                type=rel["type"],
+                description=rel.get("description", ""),
+                chapter=rel.get("chapter", 0)
+            )
+            for rel in relationships
+        ]
+        return self._index_manager.upsert_relationships(rels)
+
     def get_entity_relationships(self, entity_id: str, direction: str = "both") -> List[Dict]:
         """获取实体的关系"""
         return self._index_manager.get_entity_relationships(entity_id, direction)
@@ -456,10 +479,7 @@ class SQLStateManager:
             cursor = conn.cursor()
             cursor.execute("SELECT alias, entity_id, entity_type FROM aliases")
             for row in cursor.fetchall():
-                alias = row["alias"]
-                if alias not in result:
-                    result[alias] = []
-                result[alias].append({
+                result.setdefault(row["alias"], []).append({
                     "type": row["entity_type"],
                     "id": row["entity_id"]
                 })
@@ -380,6 +380,14 @@ class TestIndexManager:
         assert result["title"] == "突破"
         assert "xiaoyan" in result["characters"]
 
+    def test_index_db_uses_wal_journal(self, temp_project):
+        manager = IndexManager(temp_project)
+
+        with manager._get_conn() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            # synchronous=NORMAL 对应值 1
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
     def test_add_scenes(self, temp_project):
         manager = IndexManager(temp_project)
 
@@ -477,6 +485,12 @@ class TestIndexManager:
         entity = manager.get_entity("xiaoyan")
         assert entity["current_json"]["realm"] == "斗师"
 
+        # 批量获取（重复/不存在的 ID 被忽略）
+        batch = manager.get_entities_by_ids(["xiaoyan", "missing", "xiaoyan"])
+        assert list(batch) == ["xiaoyan"]
+        assert batch["xiaoyan"]["current_json"]["realm"] == "斗师"
+        assert manager.get_entities_by_ids([]) == {}
+
         # 元数据更新
         entity_main.desc = "主角（更新）"
         entity_main.last_appearance = 3
@@ -522,6 +536,18 @@ class TestIndexManager:
         assert len(manager.get_relationship_between("xiaoyan", "yaolao")) == 1
         assert len(manager.get_recent_relationships(limit=5)) >= 1
 
+        # both：两个方向合并按章节倒序，自环关系只出现一次
+        manager.upsert_relationship(
+            RelationshipMeta(from_entity="xuner", to_entity="xiaoyan", type="青梅竹马", description="", chapter=5)
+        )
+        manager.upsert_relationship(
+            RelationshipMeta(from_entity="xiaoyan", to_entity="xiaoyan", type="心魔", description="", chapter=3)
+        )
+        both = manager.get_entity_relationships("xiaoyan", "both")
+        assert len(both) == 3
+        assert [r["chapter"] for r in both] == sorted((r["chapter"] for r in both), reverse=True)
+        assert sum(1 for r in both if r["type"] == "心魔") == 1
+
     def test_state_changes_and_appearances(self, temp_project):
         manager = IndexManager(temp_project)
 
@@ -559,6 +585,21 @@ class TestIndexManager:
         assert len(manager.get_recent_appearances(limit=5)) >= 1
         assert len(manager.get_chapter_appearances(2)) == 1
 
+    def test_record_appearance_upsert_keeps_or_updates_mentions(self, temp_project):
+        manager = IndexManager(temp_project)
+
+        manager.record_appearance("xiaoyan", 1, ["萧炎"], 0.8)
+        manager.record_appearance("xiaoyan", 1, ["炎帝"], 0.5, skip_if_exists=True)
+        row = manager.get_chapter_appearances(1)[0]
+        assert row["mentions"] == ["萧炎"]
+        assert row["confidence"] == 0.8
+
+        manager.record_appearance("xiaoyan", 1, ["萧炎", "炎帝"], 0.9)
+        rows = manager.get_chapter_appearances(1)
+        assert len(rows) == 1
+        assert rows[0]["mentions"] == ["萧炎", "炎帝"]
+        assert rows[0]["confidence"] == 0.9
+
     def test_chapter_queries_and_bulk(self, temp_project):
         manager = IndexManager(temp_project)
 
@@ -615,12 +656,24 @@ class TestIndexManager:
             title="试炼",
             location="秘境",
             word_count=1500,
-            entities=[{"id": "xiaoyan", "type": "角色", "mentions": ["萧炎"]}],
+            entities=[
+                {"id": "xiaoyan", "type": "角色", "mentions": ["萧炎"]},
+                {"id": "yaolao", "type": "角色", "mentions": ["药老"], "confidence": 0.8},
+                {"id": "NEW", "type": "角色", "mentions": ["路人"]},
+            ],
             scenes=[{"index": 1, "start_line": 1, "end_line": 20, "location": "秘境", "summary": "开场", "characters": ["xiaoyan"]}],
         )
         assert stats["chapters"] == 1
         assert stats["scenes"] == 1
-        assert stats["appearances"] == 1
+        assert stats["appearances"] == 2
+        yaolao_rows = manager.get_entity_appearances("yaolao")
+        assert [(r["chapter"], r["mentions"], r["confidence"]) for r in yaolao_rows] == [(10, ["药老"], 0.8)]
+        assert manager.get_entity_appearances("NEW") == []
+        assert manager.record_appearances(10, []) == 0
+
+        # 单条 API 按给定 id 原样写入，过滤只发生在 process_chapter_data
+        manager.record_appearance("NEW", 11, ["路人"])
+        assert [r["chapter"] for r in manager.get_entity_appearances("NEW")] == [11]
 
     def test_debt_and_override_flow(self, temp_project):
         manager = IndexManager(temp_project)
@@ -85,6 +85,92 @@ def test_migrate_state_to_sqlite_flow(temp_project):
     assert entity is not None
 
 
+def test_migrate_aliases_skip_bad_entry_and_retry_per_row(temp_project, monkeypatch):
+    state = {
+        "alias_index": {
+            "甲": [{"type": "角色", "id": "a"}],
+            "乙": [{"type": "角色", "id": ["b"]}],
+            "丙": [{"type": "角色", "id": "c"}],
+            "丁": [{"type": "角色", "id": 7}],
+        },
+    }
+    temp_project.state_file.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+
+    stats = migrate_state_to_sqlite(temp_project, dry_run=False, backup=False, verbose=False)
+    assert stats["aliases"] == 3
+    assert stats["skipped"] == 1
+    assert stats["errors"] == 0
+
+    idx = IndexManager(temp_project)
+    assert idx.get_entity_aliases("a") == ["甲"]
+    assert idx.get_entity_aliases("c") == ["丙"]
+    assert idx.get_entity_aliases("7") == ["丁"]
+
+    # 整批失败时逐条重试，只有坏行计错
+    temp_project.state_file.write_text(
+        json.dumps({"alias_index": {"丁": [{"type": "角色", "id": "d"}], "戊": [{"type": "角色", "id": "e"}]}}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    original_register_alias = migrate_module.SQLStateManager.register_alias
+
+    def _register_alias(self, alias, entity_id, entity_type):
+        if alias == "戊":
+            raise RuntimeError("boom")
+        return original_register_alias(self, alias, entity_id, entity_type)
+
+    def _boom(self, rows):
+        raise RuntimeError("batch boom")
+
+    monkeypatch.setattr(migrate_module.SQLStateManager, "register_aliases", _boom)
+    monkeypatch.setattr(migrate_module.SQLStateManager, "register_alias", _register_alias)
+
+    stats = migrate_state_to_sqlite(temp_project, dry_run=False, backup=False, verbose=True)
+    assert stats["aliases"] == 1
+    assert stats["errors"] == 1
+    assert idx.get_entity_aliases("d") == ["丁"]
+
+
+def test_migrate_relationships_coerce_bad_row_and_retry_per_row(temp_project, monkeypatch):
+    state = {
+        "structured_relationships": [
+            {"from_entity": "a", "to_entity": "b", "type": "师徒", "description": "收徒", "chapter": 1},
+            {"from_entity": "a", "to_entity": "c", "type": "", "description": None, "chapter": None},
+            {"from_entity": "b", "to_entity": "c", "type": "同门", "chapter": "3"},
+        ],
+    }
+    temp_project.state_file.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+
+    stats = migrate_state_to_sqlite(temp_project, dry_run=False, backup=False, verbose=False)
+    assert stats["relationships"] == 3
+    assert stats["errors"] == 0
+
+    idx = IndexManager(temp_project)
+    coerced = idx.get_relationship_between("a", "c")[0]
+    assert coerced["type"] == "相识"
+    assert coerced["description"] == ""
+    assert coerced["chapter"] == 0
+    assert idx.get_relationship_between("b", "c")[0]["chapter"] == 3
+
+    # 整批失败时逐条重试，只有坏行计错
+    temp_project.state_file.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+    original_upsert = migrate_module.SQLStateManager.upsert_relationship
+
+    def _upsert_relationship(self, **row):
+        if row["to_entity"] == "c" and row["from_entity"] == "a":
+            raise RuntimeError("boom")
+        return original_upsert(self, **row)
+
+    def _boom(self, rows):
+        raise RuntimeError("batch boom")
+
+    monkeypatch.setattr(migrate_module.SQLStateManager, "upsert_relationships", _boom)
+    monkeypatch.setattr(migrate_module.SQLStateManager, "upsert_relationship", _upsert_relationship)
+
+    stats = migrate_state_to_sqlite(temp_project, dry_run=False, backup=False, verbose=True)
+    assert stats["relationships"] == 2
+    assert stats["errors"] == 1
+
+
 def test_slim_helpers():
     world = {
         "power_system": [{"name": "斗者"}],
@@ -194,12 +280,18 @@ def test_migrate_state_error_branches(tmp_path, monkeypatch):
         def upsert_entity(self, *args, **kwargs):
             raise RuntimeError("boom")
 
+        def register_aliases(self, *args, **kwargs):
+            raise RuntimeError("boom")
+
         def register_alias(self, *args, **kwargs):
             raise RuntimeError("boom")
 
         def record_state_change(self, *args, **kwargs):
             raise RuntimeError("boom")
 
+        def upsert_relationships(self, *args, **kwargs):
+            raise RuntimeError("boom")
+
         def upsert_relationship(self, *args, **kwargs):
             raise RuntimeError("boom")
 
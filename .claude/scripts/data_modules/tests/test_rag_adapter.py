@@ -77,6 +77,12 @@ async def test_store_and_search(temp_project):
     assert stats["vectors"] == 2
 
 
+def test_vector_db_uses_wal_journal(temp_project):
+    adapter = RAGAdapter(temp_project)
+    with adapter._get_conn() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
 @pytest.mark.asyncio
 async def test_store_chunks_with_embedding_failure(tmp_path, monkeypatch):
     cfg = DataModulesConfig.from_project_root(tmp_path)
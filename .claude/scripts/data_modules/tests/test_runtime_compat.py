@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import sys
+from pathlib import Path
+
+
+def _load_module():
+    scripts_dir = Path(__file__).resolve().parents[2]
+    if str(scripts_dir) not in sys.path:
+        sys.path.insert(0, str(scripts_dir))
+    import runtime_compat
+
+    return runtime_compat
+
+
+def test_enable_windows_utf8_stdio_reconfigures_in_place(monkeypatch):
+    module = _load_module()
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="gbk")
+    stderr = io.TextIOWrapper(io.BytesIO(), encoding="gbk")
+    monkeypatch.setattr(module.sys, "platform", "win32")
+    monkeypatch.setattr(module.sys, "stdout", stdout)
+    monkeypatch.setattr(module.sys, "stderr", stderr)
+
+    assert module.enable_windows_utf8_stdio() is True
+    assert module.sys.stdout is stdout
+    assert module.sys.stderr is stderr
+    assert stdout.encoding == "utf-8"
+    assert stderr.encoding == "utf-8"
+
+    # 已是 UTF-8 时不再处理
+    assert module.enable_windows_utf8_stdio() is False
+
+
+def test_enable_windows_utf8_stdio_noop_off_windows(monkeypatch):
+    module = _load_module()
+    monkeypatch.setattr(module.sys, "platform", "linux")
+    assert module.enable_windows_utf8_stdio() is False
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import enum
+import json
+import math
+import sys
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+def _load_module():
+    scripts_dir = Path(__file__).resolve().parents[2]
+    if str(scripts_dir) not in sys.path:
+        sys.path.insert(0, str(scripts_dir))
+    import security_utils
+
+    return security_utils
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_atomic_write_json_roundtrip_with_and_without_orjson(tmp_path, monkeypatch, has_orjson):
+    module = _load_module()
+    if has_orjson and not module.HAS_ORJSON:
+        pytest.skip("orjson 未安装")
+    monkeypatch.setattr(module, "HAS_ORJSON", has_orjson)
+
+    target = tmp_path / "state.json"
+    data = {"progress": {"current_chapter": 10}, "主角": "萧炎", 3: [1, 2]}
+    written = module.atomic_write_json(target, data, use_lock=False, backup=False)
+
+    assert written == target.stat().st_size
+    text = target.read_text(encoding="utf-8")
+    assert "萧炎" in text
+    assert json.loads(text) == {"progress": {"current_chapter": 10}, "主角": "萧炎", "3": [1, 2]}
+
+
+def test_atomic_write_json_rejects_unserializable_data(tmp_path):
+    module = _load_module()
+    target = tmp_path / "state.json"
+
+    with pytest.raises(module.AtomicWriteError):
+        module.atomic_write_json(target, {"bad": object()}, use_lock=False, backup=False)
+    assert not target.exists()
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+@pytest.mark.parametrize(
+    "bad_value",
+    [datetime(2026, 1, 1, 12, 0, 0), uuid.UUID(int=1), Color.RED],
+    ids=["datetime", "uuid", "enum"],
+)
+def test_atomic_write_json_rejects_types_stdlib_rejects(tmp_path, monkeypatch, has_orjson, bad_value):
+    module = _load_module()
+    if has_orjson and not module.HAS_ORJSON:
+        pytest.skip("orjson 未安装")
+    monkeypatch.setattr(module, "HAS_ORJSON", has_orjson)
+    target = tmp_path / "state.json"
+
+    with pytest.raises(module.AtomicWriteError):
+        module.atomic_write_json(target, {"bad": bad_value}, use_lock=False, backup=False)
+    assert not target.exists()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"progress": {"current_chapter": 10, "ratio": 0.1 + 0.2}, "主角": "萧炎\n\t\"引号\"", 3: [], 1.5: {}},
+        {"big": 1e16, "tiny": 1e-7, "max": 1.7976931348623157e308, 1e20: "key", "neg": -0.0},
+        [None, True, False, [[]], [{}], (1, 2)],
+    ],
+    ids=["plain", "exponent-floats", "nested"],
+)
+@pytest.mark.parametrize("indent", [2, None])
+def test_dumps_json_bytes_matches_stdlib_bytes(monkeypatch, data, indent):
+    module = _load_module()
+    if not module.HAS_ORJSON:
+        pytest.skip("orjson 未安装")
+
+    fast = module._dumps_json_bytes(data, indent)
+    monkeypatch.setattr(module, "HAS_ORJSON", False)
+    assert fast == module._dumps_json_bytes(data, indent)
+    assert fast == json.dumps(data, ensure_ascii=False, indent=indent).encode("utf-8")
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_atomic_write_json_keeps_non_finite_floats(tmp_path, monkeypatch, has_orjson):
+    module = _load_module()
+    if has_orjson and not module.HAS_ORJSON:
+        pytest.skip("orjson 未安装")
+    monkeypatch.setattr(module, "HAS_ORJSON", has_orjson)
+    target = tmp_path / "state.json"
+    data = {"score": float("nan"), "limits": [float("inf"), -float("inf")], "ok": 1.5}
+
+    module.atomic_write_json(target, data, use_lock=False, backup=False)
+
+    assert target.read_text(encoding="utf-8") == json.dumps(data, ensure_ascii=False, indent=2)
+    loaded = module.read_json_file(target)
+    assert math.isnan(loaded["score"])
+    assert loaded["limits"] == [float("inf"), -float("inf")]
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_read_json_file_matches_stdlib_semantics(tmp_path, monkeypatch, has_orjson):
+    module = _load_module()
+    if has_orjson and not module.HAS_ORJSON:
+        pytest.skip("orjson 未安装")
+    monkeypatch.setattr(module, "HAS_ORJSON", has_orjson)
+
+    target = tmp_path / "state.json"
+    target.write_text('{"主角": "萧炎", "big": 123456789012345678901234567890, "neg": -9223372036854775809}', encoding="utf-8")
+    loaded = module.read_json_file(target)
+    assert loaded == {"主角": "萧炎", "big": 123456789012345678901234567890, "neg": -9223372036854775809}
+    assert isinstance(loaded["neg"], int)
+
+    target.write_text('{"score": NaN}', encoding="utf-8")
+    value = module.read_json_file(target)["score"]
+    assert value != value
+
+    target.write_text('{"broken": ', encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        module.read_json_file(target)
+    assert module.read_json_safe(target, {"fallback": True}) == {"fallback": True}
@@ -56,6 +56,22 @@ def test_sql_state_manager_entity_and_alias(temp_project):
     assert updated["current_json"]["realm"] == "斗王"
 
 
+def test_sql_state_manager_register_aliases_bulk(temp_project):
+    manager = SQLStateManager(temp_project)
+    rows = [
+        ("炎帝", "xiaoyan", "角色"),
+        ("天云宗", "tianyunzong", "地点"),
+        ("天云宗", "tianyunzong_faction", "势力"),
+    ]
+    assert manager.register_aliases(rows) == 3
+    # 重复注册被忽略
+    assert manager.register_aliases(rows[:1]) == 0
+    assert manager.register_aliases([]) == 0
+
+    export = manager.export_to_alias_index_format()
+    assert len(export["天云宗"]) == 2
+
+
 def test_sql_state_manager_state_changes_and_relationships(temp_project):
     manager = SQLStateManager(temp_project)
     manager.upsert_entity(
@@ -88,6 +104,25 @@ def test_sql_state_manager_state_changes_and_relationships(temp_project):
     assert len(manager.get_recent_relationships(limit=5)) >= 1
 
 
+def test_sql_state_manager_upsert_relationships_bulk(temp_project):
+    manager = SQLStateManager(temp_project)
+    rows = [
+        {"from_entity": "xiaoyan", "to_entity": "yaolao", "type": "师徒", "description": "拜师", "chapter": 1},
+        {"from_entity": "xiaoyan", "to_entity": "xuner", "type": "青梅竹马", "chapter": 2},
+    ]
+    assert manager.upsert_relationships(rows) == 2
+    assert manager.upsert_relationships([]) == 0
+
+    # 相同 (from, to, type) 原地更新，不新增行
+    updated = [{"from_entity": "xiaoyan", "to_entity": "yaolao", "type": "师徒", "description": "出师", "chapter": 9}]
+    assert manager.upsert_relationships(updated) == 1
+    between = manager.get_relationship_between("xiaoyan", "yaolao")
+    assert len(between) == 1
+    assert between[0]["description"] == "出师"
+    assert between[0]["chapter"] == 9
+    assert len(manager.get_entity_relationships("xiaoyan", direction="from")) == 2
+
+
 def test_sql_state_manager_process_chapter_entities_and_exports(temp_project):
     manager = SQLStateManager(temp_project)
     stats = manager.process_chapter_entities(
@@ -160,3 +160,50 @@ def test_pacing_analysis_marks_missing_data_instead_of_assuming_one_point_per_ch
         assert seg["rating"] == "数据不足"
         assert seg["missing_chapters"] == 1
 
+
+def test_write_report_streams_same_content_and_returns_preview(tmp_path):
+    config = DataModulesConfig.from_project_root(tmp_path)
+    config.ensure_dirs()
+    project_root = config.project_root
+
+    state = {
+        "progress": {"current_chapter": 10, "total_words": 30000},
+        "relationships": {"李雪": {"affection": 80, "hatred": 0}},
+        "plot_threads": {
+            "foreshadowing": [
+                {"content": "神秘玉佩来历", "status": "未回收", "planted_chapter": 1, "target_chapter": 5},
+            ]
+        },
+    }
+    _write_state(project_root, state)
+
+    reporter = StatusReporter(str(project_root))
+    assert reporter.load_state() is True
+
+    output_file = project_root / ".webnovel" / "health_report.md"
+    preview = reporter.write_report(output_file, "all", preview_limit=12)
+
+    written = output_file.read_text(encoding="utf-8")
+    expected = reporter.generate_report("all")
+
+    def _without_timestamp(text: str):
+        return [line for line in text.split("\n") if "生成时间" not in line]
+
+    assert _without_timestamp(written) == _without_timestamp(expected)
+    assert len(preview) == 12
+    assert preview == written.split("\n")[:12]
+
+
+def test_extract_stats_field_matches_single_lines_with_crlf(tmp_path):
+    reporter = StatusReporter(str(tmp_path))
+    content = (
+        "# 第1章\r\n\r\n正文\r\n\r\n## 本章统计\r\n"
+        "- **主导Strand**:\r\n"
+        "  - **主导Strand** :  Quest  \r\n"
+        "- **爽点**: 打脸\r\n"
+    )
+
+    # 冒号后为空的行跳过，不跨行取值
+    assert reporter._extract_stats_field(content, "主导Strand") == "Quest"
+    assert reporter._extract_stats_field(content, "爽点") == "打脸"
+    assert reporter._extract_stats_field(content, "不存在") == ""
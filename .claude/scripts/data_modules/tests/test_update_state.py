@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+def _load_update_state_module():
+    import sys
+
+    scripts_dir = Path(__file__).resolve().parents[2]
+    if str(scripts_dir) not in sys.path:
+        sys.path.insert(0, str(scripts_dir))
+
+    import update_state
+
+    return update_state
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    webnovel = tmp_path / ".webnovel"
+    webnovel.mkdir(parents=True, exist_ok=True)
+    path = webnovel / "state.json"
+    path.write_text(
+        json.dumps(
+            {
+                "project_info": {"title": "测试"},
+                "progress": {"current_chapter": 10, "total_words": 30000},
+                "protagonist_state": {"power": {"realm": "斗者"}, "location": {"current": "乌坦城"}},
+                "relationships": {},
+                "world_settings": {},
+                "plot_threads": {"foreshadowing": []},
+                "review_checkpoints": [],
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_combined_updates_share_one_timestamp(state_file):
+    module = _load_update_state_module()
+    updater = module.StateUpdater(str(state_file))
+    assert updater.load()
+
+    updater.add_foreshadowing("神秘玉佩", "未回收")
+    updater.update_progress(11, 33000)
+    updater.mark_volume_planned(1, "1-100")
+    updater.add_review_checkpoint("1-10", "审查报告/第1-10章.md")
+
+    state = updater.state
+    today = state["plot_threads"]["foreshadowing"][0]["added_at"]
+    now_ts = state["progress"]["last_updated"]
+    assert now_ts.startswith(today)
+    assert state["progress"]["volumes_planned"][0]["planned_at"] == today
+    assert state["review_checkpoints"][-1]["reviewed_at"] == now_ts
+
+
+def test_strand_history_is_capped_in_place(state_file):
+    module = _load_update_state_module()
+    updater = module.StateUpdater(str(state_file))
+    assert updater.load()
+
+    history = updater.state["strand_tracker"]["history"]
+    history.extend({"chapter": i, "dominant": "quest"} for i in range(1, 51))
+    assert updater.update_strand_tracker("fire", 51) is True
+
+    assert updater.state["strand_tracker"]["history"] is history
+    assert len(history) == 50
+    assert history[0]["chapter"] == 2
+    assert history[-1] == {"chapter": 51, "dominant": "fire"}
+    assert updater.update_strand_tracker("unknown", 52) is False
+
+
+def test_noop_updates_skip_backup_and_save(state_file):
+    module = _load_update_state_module()
+    updater = module.StateUpdater(str(state_file))
+    assert updater.load()
+    before = state_file.read_bytes()
+
+    updater.resolve_foreshadowing("不存在的伏笔", 12)
+    assert updater.update_strand_tracker("unknown", 12) is False
+    assert updater.backup() is True
+    assert updater.save() is True
+
+    assert updater.backup_file is None
+    assert state_file.read_bytes() == before
+    assert not (state_file.parent / "backups").exists()
+
+    updater.update_progress(12, 36000)
+    assert updater.backup() is True
+    assert updater.save() is True
+    assert Path(updater.backup_file).read_bytes() == before
+    assert json.loads(state_file.read_text(encoding="utf-8"))["progress"]["current_chapter"] == 12
+
+
+def test_save_after_backup_skips_extra_bak_copy(state_file):
+    module = _load_update_state_module()
+    updater = module.StateUpdater(str(state_file))
+    assert updater.load()
+
+    updater.update_relationship("李雪", "affection", 95)
+    assert updater.backup() is True
+    assert updater.save() is True
+
+    assert Path(updater.backup_file).exists()
+    assert not state_file.with_suffix(".json.bak").exists()
+    assert json.loads(state_file.read_text(encoding="utf-8"))["relationships"]["李雪"]["affection"] == 95
+
+
+def test_save_failure_restores_run_backup(state_file, monkeypatch):
+    module = _load_update_state_module()
+    updater = module.StateUpdater(str(state_file))
+    assert updater.load()
+    before = state_file.read_bytes()
+
+    updater.update_progress(12, 36000)
+    assert updater.backup() is True
+
+    def _boom(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(module, "atomic_write_json", _boom)
+    assert updater.save() is False
+    assert state_file.read_bytes() == before
+
+
+def test_golden_finger_and_strand_rely_on_validated_schema(state_file):
+    module = _load_update_state_module()
+    state = json.loads(state_file.read_text(encoding="utf-8"))
+    state["protagonist_state"]["golden_finger"] = "旧格式"
+    state_file.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+
+    updater = module.StateUpdater(str(state_file))
+    assert updater.load()
+
+    updater.update_golden_finger("骨灵冷火", 2, 3)
+    assert updater.state["protagonist_state"]["golden_finger"] == {
+        "name": "骨灵冷火",
+        "level": 2,
+        "cooldown": 3,
+        "skills": [],
+    }
+
+    assert updater.update_strand_tracker("Quest", 11) is True
+    tracker = updater.state["strand_tracker"]
+    assert tracker["current_dominant"] == "quest"
+    assert tracker["chapters_since_switch"] == 1
+    assert tracker["last_quest_chapter"] == 11
@@ -163,6 +163,43 @@ def test_cleanup_artifacts_requires_confirm(tmp_path, monkeypatch):
     assert any(item.startswith("[预览]") for item in preview)
 
 
+def test_cleanup_artifacts_delete_failure_drops_linked_backup(tmp_path, monkeypatch):
+    module = _load_module()
+    monkeypatch.setattr(module, "find_project_root", lambda: tmp_path)
+
+    (tmp_path / ".webnovel").mkdir(parents=True, exist_ok=True)
+    draft_path = module.default_chapter_draft_path(tmp_path, 9)
+    draft_path.parent.mkdir(parents=True, exist_ok=True)
+    draft_path.write_text("draft", encoding="utf-8")
+
+    git_called = {"count": 0}
+
+    def _fake_run(*args, **kwargs):
+        git_called["count"] += 1
+        return SimpleNamespace(returncode=0, stderr="", stdout="")
+
+    monkeypatch.setattr(module.subprocess, "run", _fake_run)
+
+    original_unlink = Path.unlink
+
+    def _unlink(self, *args, **kwargs):
+        if self == draft_path:
+            raise PermissionError("locked")
+        return original_unlink(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "unlink", _unlink)
+
+    cleaned = module.cleanup_artifacts(9, confirm=True)
+
+    assert cleaned == ["❌ 章节删除失败，已撤销备份: locked"]
+    assert draft_path.read_text(encoding="utf-8") == "draft"
+    assert not list((tmp_path / ".webnovel" / "recovery_backups").glob("ch0009-*"))
+    assert git_called["count"] == 0
+
+    lines = module.get_call_trace_path().read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[-1])["event"] == "artifacts_cleanup_delete_failed"
+
+
 def test_cleanup_artifacts_confirm_deletes_with_backup(tmp_path, monkeypatch):
     module = _load_module()
     monkeypatch.setattr(module, "find_project_root", lambda: tmp_path)
@@ -174,11 +211,12 @@ def test_cleanup_artifacts_confirm_deletes_with_backup(tmp_path, monkeypatch):
     draft_path.parent.mkdir(parents=True, exist_ok=True)
     draft_path.write_text("draft", encoding="utf-8")
 
-    git_called = {"count": 0, "cmd": None}
+    git_called = {"count": 0, "cmd": None, "kwargs": None}
 
     def _fake_run(cmd, **kwargs):
         git_called["count"] += 1
         git_called["cmd"] = cmd
+        git_called["kwargs"] = kwargs
         return SimpleNamespace(returncode=0, stderr="", stdout="")
 
     monkeypatch.setattr(module.subprocess, "run", _fake_run)
@@ -188,8 +226,145 @@ def test_cleanup_artifacts_confirm_deletes_with_backup(tmp_path, monkeypatch):
     assert not draft_path.exists()
     assert git_called["count"] == 1
     assert git_called["cmd"] == ["git", "reset", "HEAD", "."]
+    assert git_called["kwargs"]["stdout"] is module.subprocess.DEVNULL
     assert any("Git 暂存区已清理" in item for item in cleaned)
 
     backup_dir = tmp_path / ".webnovel" / "recovery_backups"
     backups = list(backup_dir.glob("ch0008-*"))
     assert backups
+    assert backups[0].read_text(encoding="utf-8") == "draft"
+
+
+def test_find_project_root_caches_per_env_and_cwd(tmp_path, monkeypatch):
+    module = _load_module()
+    module._resolve_project_root_cached.cache_clear()
+
+    project_a = tmp_path / "a"
+    project_b = tmp_path / "b"
+    for root in (project_a, project_b):
+        (root / ".webnovel").mkdir(parents=True)
+        (root / ".webnovel" / "state.json").write_text("{}", encoding="utf-8")
+
+    calls = []
+    real_resolve = module.resolve_project_root
+
+    def _counting_resolve(*args, **kwargs):
+        calls.append(kwargs.get("cwd"))
+        return real_resolve(*args, **kwargs)
+
+    monkeypatch.setattr(module, "resolve_project_root", _counting_resolve)
+    monkeypatch.delenv("WEBNOVEL_PROJECT_ROOT", raising=False)
+    monkeypatch.chdir(project_a)
+
+    assert module.find_project_root() == project_a.resolve()
+    assert module.find_project_root() == project_a.resolve()
+    assert len(calls) == 1
+
+    monkeypatch.setenv("WEBNOVEL_PROJECT_ROOT", str(project_b))
+    assert module.find_project_root() == project_b.resolve()
+    assert len(calls) == 2
+
+    module._resolve_project_root_cached.cache_clear()
+
+
+def test_step_allowed_before_uses_sequence_prefix():
+    module = _load_module()
+
+    done = [{"id": "Step 1"}, {"id": "Step 1.5"}]
+    assert module.step_allowed_before("webnovel-write", "Step 2A", done) is True
+    assert module.step_allowed_before("webnovel-write", "Step 2B", done) is False
+    assert module.step_allowed_before("webnovel-write", "Step 1", []) is True
+    assert module.step_allowed_before("webnovel-write", "Step 9", []) is True
+    assert module.step_allowed_before("unknown", "Step 3", []) is True
+
+    pending = module.get_pending_steps("webnovel-review")
+    assert pending[0] == "Step 1" and len(pending) == 8
+    pending.append("mutated")
+    assert module.get_pending_steps("webnovel-review")[-1] == "Step 8"
+    assert module.get_pending_steps("unknown") == []
+
+
+def test_backup_chapter_falls_back_to_copy_when_link_fails(tmp_path, monkeypatch):
+    module = _load_module()
+
+    chapter_path = tmp_path / "正文" / "第0003章.md"
+    chapter_path.parent.mkdir(parents=True)
+    chapter_path.write_text("正文内容", encoding="utf-8")
+
+    def _no_link(src, dst):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(module.os, "link", _no_link)
+    backup_path = module._backup_chapter_for_cleanup(tmp_path, 3, chapter_path)
+
+    assert backup_path.read_text(encoding="utf-8") == "正文内容"
+    assert chapter_path.exists()
+
+
+def test_start_step_moves_unfinished_step_to_failed(tmp_path, monkeypatch):
+    module = _load_module()
+    monkeypatch.setattr(module, "find_project_root", lambda: tmp_path)
+    (tmp_path / ".webnovel").mkdir(parents=True, exist_ok=True)
+
+    module.start_task("webnovel-write", {"chapter_num": 9})
+    module.start_step("Step 1", "Context")
+    module.start_step("Step 1", "Context retry")
+
+    task = module.load_state()["current_task"]
+    assert len(task["failed_steps"]) == 1
+    failed = task["failed_steps"][0]
+    assert failed["name"] == "Context"
+    assert failed["status"] == module.STEP_STATUS_FAILED
+    assert failed["failure_reason"] == "step_replaced_before_completion"
+    assert task["current_step"]["name"] == "Context retry"
+    assert task["current_step"]["status"] == module.STEP_STATUS_RUNNING
+
+
+def test_step_transitions_share_one_timestamp(tmp_path, monkeypatch):
+    module = _load_module()
+    monkeypatch.setattr(module, "find_project_root", lambda: tmp_path)
+    (tmp_path / ".webnovel").mkdir(parents=True, exist_ok=True)
+
+    module.start_task("webnovel-write", {"chapter_num": 3})
+    module.start_step("Step 1", "Context")
+    task = module.load_state()["current_task"]
+    assert task["last_heartbeat"] == task["current_step"]["started_at"]
+
+    module.complete_step("Step 1")
+    task = module.load_state()["current_task"]
+    assert task["last_heartbeat"] == task["completed_steps"][-1]["completed_at"]
+
+
+def test_recovery_options_step2_offers_rollback_only_when_chapter_exists(tmp_path, monkeypatch):
+    module = _load_module()
+    monkeypatch.setattr(module, "find_project_root", lambda: tmp_path)
+
+    interrupt = {"command": "webnovel-write", "args": {"chapter_num": 5}, "current_step": {"id": "Step 2A"}}
+    options = module.analyze_recovery_options(interrupt)
+    assert [opt["option"] for opt in options] == ["A"]
+
+    draft_path = module.default_chapter_draft_path(tmp_path, 5)
+    draft_path.parent.mkdir(parents=True, exist_ok=True)
+    draft_path.write_text("半成品", encoding="utf-8")
+    options = module.analyze_recovery_options(interrupt)
+    assert [opt["option"] for opt in options] == ["A", "B"]
+
+
+def test_complete_task_spills_old_history_to_log(tmp_path, monkeypatch):
+    module = _load_module()
+    monkeypatch.setattr(module, "find_project_root", lambda: tmp_path)
+    monkeypatch.setattr(module, "HISTORY_MAX_ENTRIES", 3)
+
+    (tmp_path / ".webnovel").mkdir(parents=True, exist_ok=True)
+
+    for chapter in range(1, 6):
+        module.start_task("webnovel-write", {"chapter_num": chapter})
+        module.complete_task()
+
+    history = module.load_state()["history"]
+    assert [entry["task_id"] for entry in history] == ["task_003", "task_004", "task_005"]
+    assert [entry["chapter"] for entry in history] == [3, 4, 5]
+
+    log_lines = module.get_history_log_path().read_text(encoding="utf-8").splitlines()
+    spilled = [json.loads(line) for line in log_lines]
+    assert [entry["task_id"] for entry in spilled] == ["task_001", "task_002"]
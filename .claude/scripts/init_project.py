@@ -23,7 +23,7 @@ from datetime import datetime
 from pathlib import Path
 
 from runtime_compat import enable_windows_utf8_stdio
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import re
 
 # 安全修复：导入安全工具函数
@@ -118,7 +118,7 @@ def _render_team_rows(names: List[str], roles: List[str]) -> List[str]:
     return rows
 
 
-def _ensure_state_schema(state: Dict[str, Any]) -> Dict[str, Any]:
+def _ensure_state_schema(state: Dict[str, Any], *, now_ts: Optional[str] = None) -> Dict[str, Any]:
     """确保 state.json 具备 v5.1 架构所需的字段集合（v5.4 沿用）。
 
     v5.1 变更:
@@ -153,7 +153,7 @@ def _ensure_state_schema(state: Dict[str, Any]) -> Dict[str, Any]:
     # progress schema evolution
     state["progress"].setdefault("current_chapter", 0)
     state["progress"].setdefault("total_words", 0)
-    state["progress"].setdefault("last_updated", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    state["progress"].setdefault("last_updated", now_ts or datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     state["progress"].setdefault("volumes_completed", [])
     state["progress"].setdefault("current_volume", 1)
     state["progress"].setdefault("volumes_planned", [])
@@ -293,8 +293,13 @@ def init_project(
     else:
         state = {}
 
-    state = _ensure_state_schema(state)
-    created_at = state.get("project_info", {}).get("created_at") or datetime.now().strftime("%Y-%m-%d")
+    # 单次初始化只取一次当前时间，后续日期/时间戳均由此派生
+    started_at = datetime.now()
+    now = started_at.strftime("%Y-%m-%d")
+    now_ts = started_at.strftime("%Y-%m-%d %H:%M:%S")
+
+    state = _ensure_state_schema(state, now_ts=now_ts)
+    created_at = state.get("project_info", {}).get("created_at") or now
 
     state["project_info"].update(
         {
@@ -347,7 +352,7 @@ def init_project(
     if not state["protagonist_state"]["golden_finger"].get("name"):
         state["protagonist_state"]["golden_finger"]["name"] = "未命名金手指"
 
-    state["progress"]["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    state["progress"]["last_updated"] = now_ts
     state_path.parent.mkdir(parents=True, exist_ok=True)
     # 使用原子化写入（初始化不需要备份旧文件）
     atomic_write_json(state_path, state, use_lock=True, backup=False)
@@ -380,7 +385,6 @@ def init_project(
     output_antagonist = _read_text_if_exists(output_templates_dir / "设定集-反派设计.md")
 
     # 基础文件（只在缺失时生成，避免覆盖已有内容）
-    now = datetime.now().strftime("%Y-%m-%d")
 
     worldview_content = output_worldview.strip() if output_worldview else ""
     if not worldview_content:
@@ -689,6 +693,9 @@ __pycache__/
 .webnovel/context_cache.json
 .webnovel/*.lock
 .webnovel/*.bak
+# SQLite WAL sidecars (transient, only valid next to the live .db)
+.webnovel/*.db-wal
+.webnovel/*.db-shm
 """,
                         encoding="utf-8",
                     )
@@ -29,9 +29,15 @@ def enable_windows_utf8_stdio(*, skip_in_pytest: bool = False) -> bool:
     try:
         import io
 
-        if hasattr(sys.stdout, "buffer"):
+        # Prefer reconfigure(): switches encoding in place, keeping the original stream object
+        # (a replaced wrapper would close the shared buffer when garbage-collected).
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(encoding="utf-8")
+        elif hasattr(sys.stdout, "buffer"):
             sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
-        if hasattr(sys.stderr, "buffer"):
+        if hasattr(sys.stderr, "reconfigure"):
+            sys.stderr.reconfigure(encoding="utf-8")
+        elif hasattr(sys.stderr, "buffer"):
             sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
         return True
     except Exception:
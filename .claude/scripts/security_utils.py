@@ -9,6 +9,7 @@
 """
 
 import json
+import math
 import os
 import re
 import sys
@@ -18,13 +19,20 @@ from pathlib import Path
 from runtime_compat import enable_windows_utf8_stdio
 from typing import Any, Dict, Optional, Union
 
-# 尝试导入 filelock（可选依赖）
+# 检测 filelock（可选依赖）；导入推迟到首次加锁写入（其导入会连带加载 asyncio，耗时数十毫秒）
 try:
-    from filelock import FileLock
-    HAS_FILELOCK = True
-except ImportError:
+    from importlib.util import find_spec
+    HAS_FILELOCK = find_spec("filelock") is not None
+except (ImportError, ValueError):
     HAS_FILELOCK = False
 
+# 尝试导入 orjson（可选依赖，加速 JSON 序列化）
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 def sanitize_filename(name: str, max_length: int = 100) -> str:
     """
@@ -338,6 +346,97 @@ class AtomicWriteError(Exception):
     pass
 
 
+_PLAIN_JSON_SCALARS = frozenset((str, int, bool, type(None)))
+
+
+def _float_matches_stdlib(value: float) -> bool:
+    """有限且非指数形式的 float 两边输出一致；指数形式 orjson 写 1e16，标准库写 1e+16"""
+    return math.isfinite(value) and "e" not in repr(value)
+
+
+def _is_plain_json(data: Any) -> bool:
+    """
+    判断数据是否只含 orjson 与标准库输出一致的类型
+
+    允许 dict/list/tuple/str/int/bool/None 与有限、非指数形式的 float（按精确类型判断，子类不算）。
+    NaN/±Inf（orjson 写成 null，标准库写成 NaN）、指数形式 float（1e16 vs 1e+16）、
+    UUID/Enum/datetime 等 orjson 原生支持而标准库拒绝的类型、以及重复引用的容器（可能成环）
+    均返回 False。
+    """
+    seen = set()
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        obj_type = type(obj)
+        if obj_type is dict:
+            if id(obj) in seen:
+                return False
+            seen.add(id(obj))
+            for key, value in obj.items():
+                key_type = type(key)
+                if key_type is float:
+                    if not _float_matches_stdlib(key):
+                        return False
+                elif key_type not in _PLAIN_JSON_SCALARS:
+                    return False
+                stack.append(value)
+        elif obj_type is list or obj_type is tuple:
+            if id(obj) in seen:
+                return False
+            seen.add(id(obj))
+            stack.extend(obj)
+        elif obj_type is float:
+            if not _float_matches_stdlib(obj):
+                return False
+        elif obj_type not in _PLAIN_JSON_SCALARS:
+            return False
+    return True
+
+
+def _dumps_json_bytes(data: Any, indent: Optional[int]) -> bytes:
+    """
+    序列化为 UTF-8 编码的 JSON 字节
+
+    orjson 可用、缩进为 2 且数据只含普通 JSON 类型时走 C 实现快速路径（输出与标准库逐字节一致）；
+    其余情况（indent=None 时分隔符不同、NaN/±Inf、指数形式 float、datetime/UUID/dataclass 等、
+    超大整数）交给标准库，输出与报错行为与标准库一致。
+    """
+    if HAS_ORJSON and indent == 2 and _is_plain_json(data):
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+            | orjson.OPT_INDENT_2
+        )
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=indent).encode('utf-8')
+
+
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
+
+def read_json_file(file_path: Union[str, Path]) -> Any:
+    """
+    读取并解析 UTF-8 JSON 文件
+
+    orjson 可用时直接解析字节走快速路径；orjson 拒绝的输入（NaN 等）回退到标准库，
+    解析失败时抛出 json.JSONDecodeError，与 json.load 一致。
+    orjson 会把超出 64 位的整数静默转成 float，含 19 位以上连续数字时直接走标准库。
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if HAS_ORJSON and not _LONG_DIGITS_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode('utf-8'))
+
+
 def atomic_write_json(
     file_path: Union[str, Path],
     data: Dict[str, Any],
@@ -345,25 +444,29 @@ def atomic_write_json(
     use_lock: bool = True,
     backup: bool = True,
     indent: int = 2
-) -> None:
+) -> int:
     """
     原子化写入 JSON 文件，防止并发冲突和数据损坏 (CWE-362, CWE-367)
 
     安全关键函数 - 修复 state.json 并发写入风险
 
     实现策略:
-    1. 写入临时文件（同目录，确保同文件系统）
+    1. 写入临时文件（同目录，确保同文件系统；orjson 可用时用其序列化）
     2. 可选：使用 filelock 获取排他锁
     3. 可选：备份原文件
     4. 原子重命名（os.replace 在 POSIX 上是原子的）
 
     Args:
         file_path: 目标文件路径
-        data: 要写入的字典数据
+        data: 要写入的字典数据（按引用直接序列化一次，不做防御性拷贝；
+              崩溃安全由临时文件 + 原子重命名保证）
         use_lock: 是否使用文件锁（需要 filelock 库）
         backup: 是否在写入前备份原文件
         indent: JSON 缩进（默认 2）
 
+    Returns:
+        写入的字节数（即目标文件的新大小，调用方无需再 stat）
+
     Raises:
         AtomicWriteError: 写入失败时抛出
 
@@ -380,9 +483,9 @@ def atomic_write_json(
     parent_dir = file_path.parent
     parent_dir.mkdir(parents=True, exist_ok=True)
 
-    # 准备 JSON 内容
+    # 准备 JSON 内容（字节形式，直接写入二进制临时文件）
     try:
-        json_content = json.dumps(data, ensure_ascii=False, indent=indent)
+        json_content = _dumps_json_bytes(data, indent)
     except (TypeError, ValueError) as e:
         raise AtomicWriteError(f"JSON 序列化失败: {e}")
 
@@ -399,7 +502,7 @@ def atomic_write_json(
 
     try:
         # Step 1: 写入临时文件
-        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        with os.fdopen(fd, 'wb') as f:
             f.write(json_content)
             f.flush()
             os.fsync(f.fileno())  # 确保写入磁盘
@@ -407,6 +510,7 @@ def atomic_write_json(
         # Step 2: 获取锁（如果可用且启用）
         lock = None
         if use_lock and HAS_FILELOCK:
+            from filelock import FileLock
             lock = FileLock(str(lock_path), timeout=10)
             lock.acquire()
 
@@ -427,6 +531,8 @@ def atomic_write_json(
             if lock is not None:
                 lock.release()
 
+        return len(json_content)
+
     except Exception as e:
         raise AtomicWriteError(f"原子写入失败: {e}")
 
@@ -464,8 +570,7 @@ def read_json_safe(
         return default
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_json_file(file_path)
     except (json.JSONDecodeError, OSError) as e:
         print(f"⚠️ 读取 JSON 失败 ({file_path}): {e}", file=sys.stderr)
         return default
@@ -82,10 +82,12 @@ import json
 import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, Iterator, List, Any, Tuple, Optional
 from datetime import datetime
 from collections import defaultdict
+from operator import itemgetter
 from project_locator import resolve_project_root
 from chapter_paths import extract_chapter_num_from_filename
 from runtime_compat import enable_windows_utf8_stdio
@@ -114,6 +116,46 @@ except ImportError:
         to_positive_int,
     )
 
+# 报告状态标签（集中定义，判定时按集合成员比较，避免散落的子串匹配）
+STATUS_ACTIVE = "✅ 活跃"
+STATUS_NORMAL = "🟢 正常"
+STATUS_ABSENT_MILD = "🟡 轻度掉线"
+STATUS_ABSENT_SEVERE = "🔴 严重掉线"
+STATUS_OVERTIME_MILD = "🟡 轻度超时"
+STATUS_OVERTIME_SEVERE = "🔴 严重超时"
+STATUS_EXPIRED = "🔴 已超期"
+STATUS_URGENT = "🔴 紧急"
+STATUS_WARNING = "🟡 警告"
+STATUS_UNKNOWN = "⚪ 数据不足"
+
+DROPPED_ABSENCE_STATUSES = frozenset({STATUS_ABSENT_MILD, STATUS_ABSENT_SEVERE})
+OVERDUE_FORESHADOWING_STATUSES = frozenset({STATUS_OVERTIME_MILD, STATUS_OVERTIME_SEVERE, STATUS_EXPIRED})
+
+# 各章节末尾统一的分隔块
+_SECTION_FOOTER = ("", "---", "")
+
+# 表格行字段提取器（一次调用取齐整行所需字段）
+_OVERDUE_ROW_FIELDS = itemgetter("content", "planted_chapter", "elapsed", "status")
+_URGENCY_ROW_FIELDS = itemgetter("content", "tier", "planted_chapter", "target_chapter", "urgency", "status")
+
+# 章节扫描用正则（模块级预编译，逐章复用）
+_CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+_HEADING_RE = re.compile(r'#+ .+')
+_HR_RE = re.compile(r'---')
+_PATTERN_SPLIT_RE = re.compile(r"[、,，/|+；;]+")
+# 行内空白（不含换行），保证多行模式下仍按单行匹配（兼容 CRLF）
+_INLINE_WS = r"[^\S\r\n]*"
+
+
+@lru_cache(maxsize=None)
+def _stats_field_re(field_name: str) -> "re.Pattern[str]":
+    """“本章统计”字段行的正则（按字段名缓存）"""
+    return re.compile(
+        rf"^{_INLINE_WS}-{_INLINE_WS}\*\*{re.escape(field_name)}\*\*{_INLINE_WS}:{_INLINE_WS}([^\r\n]+?){_INLINE_WS}\r?$",
+        re.MULTILINE,
+    )
+
+
 def _is_resolved_foreshadowing_status(raw_status: Any) -> bool:
     """判断伏笔是否已回收（兼容历史字段与同义词）。"""
     return is_resolved_foreshadowing_status(raw_status)
@@ -144,12 +186,8 @@ class StatusReporter:
         从“本章统计”区块提取字段值，例如：
         - **主导Strand**: quest
         """
-        pattern = rf"^\s*-\s*\*\*{re.escape(field_name)}\*\*\s*:\s*(.+?)\s*$"
-        for line in content.splitlines():
-            m = re.match(pattern, line)
-            if m:
-                return m.group(1).strip()
-        return ""
+        m = _stats_field_re(field_name).search(content)
+        return m.group(1).strip() if m else ""
 
     def load_state(self) -> bool:
         """加载 state.json"""
@@ -234,9 +272,9 @@ class StatusReporter:
                 remaining = target_chapter - current_chapter
 
             if remaining is not None and remaining < 0:
-                overtime_status = "🔴 已超期"
+                overtime_status = STATUS_EXPIRED
             elif elapsed is None:
-                overtime_status = "⚪ 数据不足"
+                overtime_status = STATUS_UNKNOWN
             else:
                 overtime_status = self._get_foreshadowing_status(elapsed)
 
@@ -257,9 +295,9 @@ class StatusReporter:
                 urgency = round(weight * 2.0, 2)
 
             if remaining is not None and remaining < 0:
-                urgency_status = "🔴 已超期"
+                urgency_status = STATUS_EXPIRED
             elif urgency is None:
-                urgency_status = "⚪ 数据不足"
+                urgency_status = STATUS_UNKNOWN
             else:
                 urgency_status = self._get_urgency_status(urgency, remaining if remaining is not None else 0)
 
@@ -299,7 +337,7 @@ class StatusReporter:
             text = raw_value.strip()
             if not text:
                 return None
-            parts = [p.strip() for p in re.split(r"[、,，/|+；;]+", text) if p.strip()]
+            parts = [p.strip() for p in _PATTERN_SPLIT_RE.split(text) if p.strip()]
             if parts:
                 return len(set(parts))
             return 1
@@ -377,9 +415,9 @@ class StatusReporter:
                 content = f.read()
 
             # 统计字数（去除 Markdown 标记）
-            text = re.sub(r'```[\s\S]*?```', '', content)  # 去除代码块
-            text = re.sub(r'#+ .+', '', text)  # 去除标题
-            text = re.sub(r'---', '', text)  # 去除分隔线
+            text = _CODE_BLOCK_RE.sub('', content)  # 去除代码块
+            text = _HEADING_RE.sub('', text)  # 去除标题
+            text = _HR_RE.sub('', text)  # 去除分隔线
             word_count = len(text.strip())
 
             # 主导 Strand / 爽点类型（优先从"本章统计"解析）
@@ -395,12 +433,12 @@ class StatusReporter:
                     if isinstance(stored, str):
                         stored = json.loads(stored)
                     if isinstance(stored, list):
-                        for entity_id in stored:
-                            entity_id = str(entity_id).strip()
-                            if not entity_id:
-                                continue
-                            # 尝试获取 canonical_name
-                            entity = self._index_manager.get_entity(entity_id)
+                        entity_ids = [str(entity_id).strip() for entity_id in stored]
+                        entity_ids = [entity_id for entity_id in entity_ids if entity_id]
+                        # 一次批量查询获取 canonical_name
+                        entities = self._index_manager.get_entities_by_ids(entity_ids)
+                        for entity_id in entity_ids:
+                            entity = entities.get(entity_id)
                             name = entity.get("canonical_name", entity_id) if entity else entity_id
                             characters.append(name)
             except Exception:
@@ -472,13 +510,13 @@ class StatusReporter:
     def _get_absence_status(self, absence: int) -> str:
         """判断掉线状态"""
         if absence == 0:
-            return "✅ 活跃"
+            return STATUS_ACTIVE
         elif absence < self.config.character_absence_warning:
-            return "🟢 正常"
+            return STATUS_NORMAL
         elif absence < self.config.character_absence_critical:
-            return "🟡 轻度掉线"
+            return STATUS_ABSENT_MILD
         else:
-            return "🔴 严重掉线"
+            return STATUS_ABSENT_SEVERE
 
     def analyze_foreshadowing(self) -> List[Dict]:
         """分析伏笔深度"""
@@ -498,11 +536,11 @@ class StatusReporter:
     def _get_foreshadowing_status(self, elapsed: int) -> str:
         """判断伏笔超时状态"""
         if elapsed < self.config.foreshadowing_urgency_pending_medium:
-            return "🟢 正常"
+            return STATUS_NORMAL
         elif elapsed < self.config.foreshadowing_urgency_pending_high + 50:
-            return "🟡 轻度超时"
+            return STATUS_OVERTIME_MILD
         else:
-            return "🔴 严重超时"
+            return STATUS_OVERTIME_SEVERE
 
     def analyze_foreshadowing_urgency(self) -> List[Dict]:
         """
@@ -541,13 +579,13 @@ class StatusReporter:
     def _get_urgency_status(self, urgency: float, remaining: int) -> str:
         """判断紧急度状态"""
         if remaining < 0:
-            return "🔴 已超期"
+            return STATUS_EXPIRED
         elif urgency >= self.config.foreshadowing_tier_weight_sub:
-            return "🔴 紧急"
+            return STATUS_URGENT
         elif urgency >= 1.0:
-            return "🟡 警告"
+            return STATUS_WARNING
         else:
-            return "🟢 正常"
+            return STATUS_NORMAL
 
     def analyze_strand_weave(self) -> Dict:
         """
@@ -784,10 +822,10 @@ class StatusReporter:
 
         return "\n".join(lines)
 
-    def generate_report(self, focus: str = "all") -> str:
-        """生成健康报告（Markdown 格式）"""
+    def iter_report_lines(self, focus: str = "all") -> Iterator[str]:
+        """逐段生成健康报告行（Markdown 格式），便于边生成边写盘"""
 
-        report_lines = [
+        yield from [
             "# 全书健康报告",
             "",
             f"> **生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
@@ -798,33 +836,51 @@ class StatusReporter:
 
         # 基本数据
         if focus in ["all", "basic"]:
-            report_lines.extend(self._generate_basic_stats())
+            yield from self._generate_basic_stats()
 
         # 角色活跃度
         if focus in ["all", "characters"]:
-            report_lines.extend(self._generate_character_section())
+            yield from self._generate_character_section()
 
         # 伏笔深度
         if focus in ["all", "foreshadowing"]:
-            report_lines.extend(self._generate_foreshadowing_section())
+            yield from self._generate_foreshadowing_section()
 
         # 伏笔紧急度（新增）
         if focus in ["all", "foreshadowing", "urgency"]:
-            report_lines.extend(self._generate_urgency_section())
+            yield from self._generate_urgency_section()
 
         # 爽点节奏
         if focus in ["all", "pacing"]:
-            report_lines.extend(self._generate_pacing_section())
+            yield from self._generate_pacing_section()
 
         # Strand Weave 节奏（新增）
         if focus in ["all", "strand", "pacing"]:
-            report_lines.extend(self._generate_strand_section())
+            yield from self._generate_strand_section()
 
         # 人际关系
         if focus in ["all", "relationships"]:
-            report_lines.extend(self._generate_relationship_section())
+            yield from self._generate_relationship_section()
+
+    def generate_report(self, focus: str = "all") -> str:
+        """生成健康报告（Markdown 格式）"""
+        return "\n".join(self.iter_report_lines(focus))
 
-        return "\n".join(report_lines)
+    def write_report(self, output_file: Path, focus: str = "all", preview_limit: int = 30) -> List[str]:
+        """
+        流式写出健康报告，返回前 preview_limit 行用于预览
+
+        避免先拼出完整报告字符串再 split 回行列表。
+        """
+        preview_lines: List[str] = []
+        with open(output_file, 'w', encoding='utf-8') as f:
+            for index, line in enumerate(self.iter_report_lines(focus)):
+                if index:
+                    f.write("\n")
+                f.write(line)
+                if len(preview_lines) < preview_limit:
+                    preview_lines.extend(line.split("\n")[:preview_limit - len(preview_lines)])
+        return preview_lines
 
     def _generate_basic_stats(self) -> List[str]:
         """生成基本统计"""
@@ -860,7 +916,7 @@ class StatusReporter:
 
         # 筛选掉线角色
         dropped = {name: data for name, data in activity.items()
-                  if "掉线" in data["status"]}
+                  if data["status"] in DROPPED_ABSENCE_STATUSES}
 
         lines = [
             f"## ⚠️ 角色掉线（{len(dropped)}人）",
@@ -873,17 +929,19 @@ class StatusReporter:
                 "|------|---------|---------|------|"
             ])
 
-            for char_name, data in sorted(dropped.items(),
-                                         key=lambda x: x[1]["absence"],
-                                         reverse=True):
-                lines.append(
-                    f"| {char_name} | 第 {data['last_appearance']} 章 | "
-                    f"{data['absence']} 章 | {data['status']} |"
-                )
+            rows = [
+                (char_name, data["absence"], data["last_appearance"], data["status"])
+                for char_name, data in dropped.items()
+            ]
+            rows.sort(key=itemgetter(1), reverse=True)
+            lines.extend(
+                f"| {char_name} | 第 {last_appearance} 章 | {absence} 章 | {status} |"
+                for char_name, absence, last_appearance, status in rows
+            )
         else:
             lines.append("✅ 所有角色活跃度正常")
 
-        lines.extend(["", "---", ""])
+        lines.extend(_SECTION_FOOTER)
 
         return lines
 
@@ -893,9 +951,9 @@ class StatusReporter:
 
         # 筛选超时伏笔
         overdue_items = [
-            item for item in overdue if "超时" in item["status"] or "超期" in item["status"]
+            item for item in overdue if item["status"] in OVERDUE_FORESHADOWING_STATUSES
         ]
-        unknown_items = [item for item in overdue if item["status"] == "⚪ 数据不足"]
+        unknown_count = sum(1 for item in overdue if item["status"] == STATUS_UNKNOWN)
 
         lines = [
             f"## ⚠️ 伏笔超时（{len(overdue_items)}条）",
@@ -908,47 +966,57 @@ class StatusReporter:
                 "|---------|---------|---------|------|"
             ])
 
-            for item in sorted(overdue_items, key=lambda x: (x["elapsed"] if x["elapsed"] is not None else -1), reverse=True):
-                planted = item["planted_chapter"] if item["planted_chapter"] is not None else "未知"
-                elapsed = item["elapsed"] if item["elapsed"] is not None else "未知"
-                lines.append(
-                    f"| {item['content'][:30]}... | 第 {planted} 章 | "
-                    f"{elapsed} 章 | {item['status']} |"
-                )
+            keyed = [
+                (item["elapsed"] if item["elapsed"] is not None else -1, item)
+                for item in overdue_items
+            ]
+            keyed.sort(key=itemgetter(0), reverse=True)
+            lines.extend(self._format_overdue_row(item) for _, item in keyed)
         else:
             lines.append("✅ 所有伏笔进度正常")
 
-        if unknown_items:
-            lines.append("")
-            lines.append(f"⚪ 另有 {len(unknown_items)} 条伏笔缺少章节信息，无法判断是否超时")
+        if unknown_count:
+            lines.extend(["", f"⚪ 另有 {unknown_count} 条伏笔缺少章节信息，无法判断是否超时"])
 
-        lines.extend(["", "---", ""])
+        lines.extend(_SECTION_FOOTER)
 
         return lines
 
+    @staticmethod
+    def _format_overdue_row(item: Dict[str, Any]) -> str:
+        """格式化伏笔超时表格行"""
+        content, planted, elapsed, status = _OVERDUE_ROW_FIELDS(item)
+        if planted is None:
+            planted = "未知"
+        if elapsed is None:
+            elapsed = "未知"
+        return (
+            f"| {content[:30]}... | 第 {planted} 章 | "
+            f"{elapsed} 章 | {status} |"
+        )
+
     def _generate_urgency_section(self) -> List[str]:
         """生成伏笔紧急度章节（基于三层级系统）"""
         urgency_list = self.analyze_foreshadowing_urgency()
 
         # 筛选紧急伏笔
-        urgent_items = [
-            item
+        urgent_count = sum(
+            1
             for item in urgency_list
-            if (item["urgency"] is not None and item["urgency"] >= 1.0) or item["status"] == "🔴 已超期"
-        ]
+            if (item["urgency"] is not None and item["urgency"] >= 1.0) or item["status"] == STATUS_EXPIRED
+        )
 
         lines = [
-            f"## 🚨 伏笔紧急度排序（{len(urgent_items)}条需关注）",
+            f"## 🚨 伏笔紧急度排序（{urgent_count}条需关注）",
             "",
             "> 基于三层级系统：核心(×3) / 支线(×2) / 装饰(×1)",
             "> 紧急度 = (已过章节 / (目标章节-埋设章节)) × 层级权重",
             ""
         ]
 
-        unknown_items = [item for item in urgency_list if item["urgency"] is None]
-        if unknown_items:
-            lines.append(f"> {len(unknown_items)} 条伏笔缺少埋设/目标章节，紧急度记为 N/A")
-            lines.append("")
+        unknown_count = sum(1 for item in urgency_list if item["urgency"] is None)
+        if unknown_count:
+            lines.extend([f"> {unknown_count} 条伏笔缺少埋设/目标章节，紧急度记为 N/A", ""])
 
         if urgency_list:
             lines.extend([
@@ -956,22 +1024,28 @@ class StatusReporter:
                 "|---------|------|------|------|--------|------|"
             ])
 
-            for item in urgency_list[:10]:  # 只显示前10条
-                planted = f"第{item['planted_chapter']}章" if item["planted_chapter"] is not None else "未知"
-                target = f"第{item['target_chapter']}章" if item["target_chapter"] is not None else "未知"
-                urgency_text = f"{item['urgency']:.2f}" if item["urgency"] is not None else "N/A"
-                lines.append(
-                    f"| {item['content'][:20]}... | {item['tier']} | "
-                    f"{planted} | {target} | "
-                    f"{urgency_text} | {item['status']} |"
-                )
+            # 只显示前10条
+            lines.extend(self._format_urgency_row(item) for item in urgency_list[:10])
         else:
             lines.append("✅ 暂无伏笔数据")
 
-        lines.extend(["", "---", ""])
+        lines.extend(_SECTION_FOOTER)
 
         return lines
 
+    @staticmethod
+    def _format_urgency_row(item: Dict[str, Any]) -> str:
+        """格式化伏笔紧急度表格行"""
+        content, tier, planted, target, urgency, status = _URGENCY_ROW_FIELDS(item)
+        planted_text = f"第{planted}章" if planted is not None else "未知"
+        target_text = f"第{target}章" if target is not None else "未知"
+        urgency_text = f"{urgency:.2f}" if urgency is not None else "N/A"
+        return (
+            f"| {content[:20]}... | {tier} | "
+            f"{planted_text} | {target_text} | "
+            f"{urgency_text} | {status} |"
+        )
+
     def _generate_strand_section(self) -> List[str]:
         """生成 Strand Weave 节奏章节"""
         strand_data = self.analyze_strand_weave()
@@ -983,7 +1057,7 @@ class StatusReporter:
 
         if not strand_data.get("has_data"):
             lines.append(f"⚠️ {strand_data.get('message', '暂无数据')}")
-            lines.extend(["", "---", ""])
+            lines.extend(_SECTION_FOOTER)
             return lines
 
         # 占比统计
@@ -995,17 +1069,15 @@ class StatusReporter:
             "|--------|--------|------|----------|------|"
         ])
 
-        q = strand_data["quest"]
-        q_status = "✅" if cfg.strand_quest_ratio_min <= q["ratio"] <= cfg.strand_quest_ratio_max else "⚠️"
-        lines.append(f"| Quest（主线） | {q['count']} | {q['ratio']:.1f}% | {cfg.strand_quest_ratio_min}-{cfg.strand_quest_ratio_max}% | {q_status} |")
-
-        f = strand_data["fire"]
-        f_status = "✅" if cfg.strand_fire_ratio_min <= f["ratio"] <= cfg.strand_fire_ratio_max else "⚠️"
-        lines.append(f"| Fire（感情） | {f['count']} | {f['ratio']:.1f}% | {cfg.strand_fire_ratio_min}-{cfg.strand_fire_ratio_max}% | {f_status} |")
-
-        c = strand_data["constellation"]
-        c_status = "✅" if cfg.strand_constellation_ratio_min <= c["ratio"] <= cfg.strand_constellation_ratio_max else "⚠️"
-        lines.append(f"| Constellation（世界观） | {c['count']} | {c['ratio']:.1f}% | {cfg.strand_constellation_ratio_min}-{cfg.strand_constellation_ratio_max}% | {c_status} |")
+        checks = (
+            ("Quest（主线）", strand_data["quest"], cfg.strand_quest_ratio_min, cfg.strand_quest_ratio_max),
+            ("Fire（感情）", strand_data["fire"], cfg.strand_fire_ratio_min, cfg.strand_fire_ratio_max),
+            ("Constellation（世界观）", strand_data["constellation"],
+             cfg.strand_constellation_ratio_min, cfg.strand_constellation_ratio_max),
+        )
+        for label, d, lo, hi in checks:
+            status = "✅" if lo <= d["ratio"] <= hi else "⚠️"
+            lines.append(f"| {label} | {d['count']} | {d['ratio']:.1f}% | {lo}-{hi}% | {status} |")
 
         lines.append("")
 
@@ -1025,12 +1097,12 @@ class StatusReporter:
                 "### ⚠️ 违规清单",
                 ""
             ])
-            for v in strand_data["violations"]:
-                lines.append(f"- {v}")
+            lines.extend(f"- {v}" for v in strand_data["violations"])
         else:
             lines.append("### ✅ 无违规")
 
-        lines.extend(["", f"**综合健康度**: {strand_data['health']}", "", "---", ""])
+        lines.extend(["", f"**综合健康度**: {strand_data['health']}"])
+        lines.extend(_SECTION_FOOTER)
 
         return lines
 
@@ -1044,31 +1116,34 @@ class StatusReporter:
             "```"
         ]
 
-        for seg in segments:
-            words_per_point = seg["words_per_point"]
-            if words_per_point is None:
-                lines.append(
-                    f"第 {seg['start']}-{seg['end']}章   ░ 数据不足"
-                    f"（缺少爽点数据 {seg['missing_chapters']} 章）"
-                )
-                continue
-
-            bar_length = int(12 - (words_per_point / 2000 * 12))
-            bar_length = max(1, min(12, bar_length))
-            bar = "█" * bar_length
+        lines.extend(self._format_pacing_line(seg) for seg in segments)
+        lines.append("```")
+        lines.extend(_SECTION_FOOTER)
 
-            suffix = ""
-            if seg["missing_chapters"] > 0:
-                suffix = f"，缺少爽点数据 {seg['missing_chapters']} 章"
+        return lines
 
-            lines.append(
-                f"第 {seg['start']}-{seg['end']}章   {bar} {seg['rating']}"
-                f"（{words_per_point:.0f}字/爽点，记录 {seg['cool_points']} 个爽点{suffix}）"
+    @staticmethod
+    def _format_pacing_line(seg: Dict[str, Any]) -> str:
+        """格式化单段爽点节奏条形图行"""
+        words_per_point = seg["words_per_point"]
+        if words_per_point is None:
+            return (
+                f"第 {seg['start']}-{seg['end']}章   ░ 数据不足"
+                f"（缺少爽点数据 {seg['missing_chapters']} 章）"
             )
 
-        lines.extend(["```", "", "---", ""])
+        bar_length = int(12 - (words_per_point / 2000 * 12))
+        bar_length = max(1, min(12, bar_length))
+        bar = "█" * bar_length
 
-        return lines
+        suffix = ""
+        if seg["missing_chapters"] > 0:
+            suffix = f"，缺少爽点数据 {seg['missing_chapters']} 章"
+
+        return (
+            f"第 {seg['start']}-{seg['end']}章   {bar} {seg['rating']}"
+            f"（{words_per_point:.0f}字/爽点，记录 {seg['cool_points']} 个爽点{suffix}）"
+        )
 
     def _generate_relationship_section(self) -> List[str]:
         """生成人际关系章节"""
@@ -1141,24 +1216,20 @@ def main():
 
     print("\n📊 正在分析...")
 
-    # 生成报告
-    report = reporter.generate_report(args.focus)
-
-    # 保存报告
+    # 生成并保存报告（流式写盘，同时保留前 30 行预览）
     output_file = Path(args.output)
     if args.output == '.webnovel/health_report.md' and project_root != '.':
         output_file = Path(project_root) / '.webnovel' / 'health_report.md'
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(report)
+    preview_lines = reporter.write_report(output_file, args.focus)
 
     print(f"\n✅ 健康报告已生成: {output_file}")
 
     # 预览报告（前 30 行）
     print("\n" + "="*60)
     print("📄 报告预览：\n")
-    print("\n".join(report.split("\n")[:30]))
+    print("\n".join(preview_lines))
     print("\n...")
     print("="*60)
 
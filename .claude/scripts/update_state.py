@@ -57,7 +57,7 @@ from typing import Dict, Any, Optional
 # ============================================================================
 # 安全修复：导入安全工具函数（P1 MEDIUM）
 # ============================================================================
-from security_utils import create_secure_directory, atomic_write_json, restore_from_backup
+from security_utils import create_secure_directory, atomic_write_json, read_json_file, restore_from_backup
 from project_locator import resolve_state_file
 from data_modules.state_validator import (
     normalize_foreshadowing_status,
@@ -76,6 +76,18 @@ class StateUpdater:
         self.dry_run = dry_run
         self.backup_file = None
         self.state = None
+        # 是否有实际变更；无变更时跳过备份与写回
+        self._dirty = False
+        self._refresh_now()
+
+    def _refresh_now(self) -> None:
+        """刷新本次更新共用的日期/时间字符串
+
+        一次 CLI 调用内的组合更新共用同一时间戳；长生命周期复用实例时可手动刷新。
+        """
+        now = datetime.now()
+        self._today = now.strftime("%Y-%m-%d")
+        self._now_ts = now.strftime("%Y-%m-%d %H:%M:%S")
 
     def _validate_schema(self, state: Dict) -> bool:
         """验证 state.json 的基本结构（v5.0 引入，v5.4 沿用）"""
@@ -143,8 +155,7 @@ class StateUpdater:
             return False
 
         try:
-            with open(self.state_file, 'r', encoding='utf-8') as f:
-                self.state = json.load(f)
+            self.state = read_json_file(self.state_file)
 
             if not self._validate_schema(self.state):
                 print("❌ state.json 结构不完整，请检查")
@@ -157,7 +168,9 @@ class StateUpdater:
             return False
 
     def backup(self) -> bool:
-        """备份当前 state.json"""
+        """备份当前 state.json（无变更时跳过）"""
+        if not self._dirty:
+            return True
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_dir = Path(self.state_file).parent / "backups"
         # ============================================================================
@@ -185,16 +198,26 @@ class StateUpdater:
             print(json.dumps(self.state, ensure_ascii=False, indent=2))
             return True
 
+        if not self._dirty:
+            print("ℹ️  无实际变更，跳过写入")
+            return True
+
+        # 已由 backup() 做过时间戳备份时，不再让原子写入额外复制一份 .bak
+        has_backup = bool(self.backup_file) and os.path.exists(self.backup_file)
+
         try:
-            # 使用集中式原子写入（带 filelock + 自动备份）
-            atomic_write_json(self.state_file, self.state, use_lock=True, backup=True)
+            # 使用集中式原子写入（带 filelock；未单独备份时由其生成 .bak）
+            atomic_write_json(self.state_file, self.state, use_lock=True, backup=not has_backup)
             print(f"✅ 已保存（原子化）: {self.state_file}")
             return True
 
         except Exception as e:
             print(f"❌ 保存失败: {e}")
-            # 尝试从备份恢复
-            if restore_from_backup(self.state_file):
+            # 尝试从备份恢复（优先使用本次运行的备份）
+            if has_backup:
+                shutil.copy2(self.backup_file, self.state_file)
+                print(f"✅ 已从备份恢复")
+            elif restore_from_backup(self.state_file):
                 print(f"✅ 已从备份恢复")
             return False
 
@@ -214,6 +237,7 @@ class StateUpdater:
             ps["realm"] = realm
             ps["layer"] = layer
             ps["bottleneck"] = bottleneck if bottleneck != "null" else None
+        self._dirty = True
         print(f"📝 更新主角实力: {realm} {layer}层, 瓶颈: {bottleneck}")
 
     def update_protagonist_location(self, location: str, chapter: int):
@@ -230,20 +254,22 @@ class StateUpdater:
             # 平铺格式
             ps["location"] = location
             ps["location_since_chapter"] = chapter
+        self._dirty = True
         print(f"📝 更新主角位置: {location}（第{chapter}章）")
 
     def update_golden_finger(self, name: str, level: int, cooldown: int):
         """更新金手指状态"""
-        ps = self.state.setdefault("protagonist_state", {})
+        # protagonist_state 已由 _validate_schema 保证存在
+        ps = self.state["protagonist_state"]
         golden_finger = ps.get("golden_finger")
         if not isinstance(golden_finger, dict):
-            golden_finger = {}
-            ps["golden_finger"] = golden_finger
+            golden_finger = ps["golden_finger"] = {}
 
         golden_finger.setdefault("skills", [])
         golden_finger["name"] = name
         golden_finger["level"] = level
         golden_finger["cooldown"] = cooldown
+        self._dirty = True
         print(f"📝 更新金手指: {name} Lv.{level}, 冷却: {cooldown}天")
 
     def update_relationship(self, char_name: str, key: str, value: Any):
@@ -252,6 +278,7 @@ class StateUpdater:
             self.state["relationships"][char_name] = {}
 
         self.state["relationships"][char_name][key] = value
+        self._dirty = True
         print(f"📝 更新关系: {char_name}.{key} = {value}")
 
     def add_foreshadowing(self, content: str, status: str = "未回收"):
@@ -278,11 +305,12 @@ class StateUpdater:
         self.state["plot_threads"]["foreshadowing"].append({
             "content": content,
             "status": status,
-            "added_at": datetime.now().strftime("%Y-%m-%d"),
+            "added_at": self._today,
             "planted_chapter": planted_chapter,
             "target_chapter": target_chapter,
             "tier": "支线"
         })
+        self._dirty = True
         print(f"📝 添加伏笔: {content}（{status}）")
 
     def resolve_foreshadowing(self, content: str, chapter: int):
@@ -295,8 +323,9 @@ class StateUpdater:
             if item.get("content") == content:
                 item["status"] = "已回收"
                 item["resolved_chapter"] = chapter
-                item["resolved_at"] = datetime.now().strftime("%Y-%m-%d")
+                item["resolved_at"] = self._today
                 normalize_state_runtime_sections(self.state)
+                self._dirty = True
                 print(f"📝 回收伏笔: {content}（第{chapter}章）")
                 return
 
@@ -306,7 +335,8 @@ class StateUpdater:
         """更新创作进度"""
         self.state["progress"]["current_chapter"] = current_chapter
         self.state["progress"]["total_words"] = total_words
-        self.state["progress"]["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.state["progress"]["last_updated"] = self._now_ts
+        self._dirty = True
         print(f"📝 更新进度: 第{current_chapter}章, 总字数: {total_words}")
 
     def mark_volume_planned(self, volume: int, chapters_range: str):
@@ -319,14 +349,16 @@ class StateUpdater:
             if item.get("volume") == volume:
                 print(f"⚠️  第{volume}卷已规划，更新章节范围")
                 item["chapters_range"] = chapters_range
-                item["updated_at"] = datetime.now().strftime("%Y-%m-%d")
+                item["updated_at"] = self._today
+                self._dirty = True
                 return
 
         self.state["progress"]["volumes_planned"].append({
             "volume": volume,
             "chapters_range": chapters_range,
-            "planned_at": datetime.now().strftime("%Y-%m-%d")
+            "planned_at": self._today
         })
+        self._dirty = True
         print(f"📝 标记第{volume}卷已规划: 第{chapters_range}章")
 
     def add_review_checkpoint(self, chapters_range: str, report_file: str):
@@ -337,8 +369,9 @@ class StateUpdater:
         self.state["review_checkpoints"].append({
             "chapters": chapters_range,
             "report": report_file,
-            "reviewed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "reviewed_at": self._now_ts
         })
+        self._dirty = True
         print(f"📝 添加审查记录: 第{chapters_range}章 → {report_file}")
 
     def update_strand_tracker(self, strand: str, chapter: int):
@@ -351,17 +384,7 @@ class StateUpdater:
 
         strand = strand.lower()
 
-        # 初始化 strand_tracker（如果不存在）
-        if "strand_tracker" not in self.state:
-            self.state["strand_tracker"] = {
-                "last_quest_chapter": 0,
-                "last_fire_chapter": 0,
-                "last_constellation_chapter": 0,
-                "current_dominant": None,
-                "chapters_since_switch": 0,
-                "history": []
-            }
-
+        # strand_tracker 已由 _validate_schema 补全默认结构
         tracker = self.state["strand_tracker"]
 
         # 更新对应 strand 的最后章节
@@ -380,10 +403,12 @@ class StateUpdater:
             "dominant": strand
         })
 
-        # 只保留最近50章的历史（避免文件过大）
-        if len(tracker["history"]) > 50:
-            tracker["history"] = tracker["history"][-50:]
+        # 只保留最近50章的历史（避免文件过大；原地截断，不重建列表）
+        history = tracker["history"]
+        if len(history) > 50:
+            del history[:-50]
 
+        self._dirty = True
         print(f"✅ strand_tracker 已更新")
         print(f"   - 第{chapter}章主导情节线: {strand}")
         print(f"   - 该情节线已连续{tracker['chapters_since_switch']}章")
@@ -553,11 +578,6 @@ def main():
     if not updater.load():
         sys.exit(1)
 
-    # 备份（除非是 dry-run）
-    if not args.dry_run:
-        if not updater.backup():
-            sys.exit(1)
-
     print("\n📝 开始更新...")
 
     # 执行更新操作
@@ -610,13 +630,18 @@ def main():
             strand, chapter = args.strand_dominant
             updater.update_strand_tracker(strand, int(chapter))
 
+        # 备份（除非是 dry-run；更新只在内存中进行，写回前备份与更新前等价，无变更时跳过）
+        if not args.dry_run:
+            if not updater.backup():
+                sys.exit(1)
+
         # 保存更新
         if not updater.save():
             sys.exit(1)
 
         print("\n✅ 更新完成！")
 
-        if not args.dry_run:
+        if not args.dry_run and updater.backup_file:
             print(f"\n💡 提示:")
             print(f"  - 原文件已备份: {updater.backup_file}")
             print(f"  - 如需回滚，可复制备份文件到 {updater.state_file}")
@@ -16,13 +16,14 @@ import shutil
 import subprocess
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from chapter_paths import default_chapter_draft_path, find_chapter_file
 from project_locator import resolve_project_root
 from runtime_compat import enable_windows_utf8_stdio
-from security_utils import atomic_write_json, create_secure_directory
+from security_utils import atomic_write_json, create_secure_directory, read_json_file
 
 
 logger = logging.getLogger(__name__)
@@ -42,14 +43,49 @@ STEP_STATUS_RUNNING = "running"
 STEP_STATUS_COMPLETED = "completed"
 STEP_STATUS_FAILED = "failed"
 
+# Completed-task entries kept inline in workflow_state.json; older ones go to history.log.
+HISTORY_MAX_ENTRIES = 50
+
+_STEP_SEQUENCES = {
+    "webnovel-write": ("Step 1", "Step 1.5", "Step 2A", "Step 2B", "Step 3", "Step 4", "Step 5", "Step 6"),
+    "webnovel-review": ("Step 1", "Step 2", "Step 3", "Step 4", "Step 5", "Step 6", "Step 7", "Step 8"),
+}
+
+_WRITE_STEP_OWNERS = {
+    "Step 1": "context-agent",
+    "Step 1.5": "webnovel-write-skill",
+    "Step 2A": "writer-draft",
+    "Step 2B": "style-adapter",
+    "Step 3": "review-agents",
+    "Step 4": "polish-agent",
+    "Step 5": "data-agent",
+    "Step 6": "backup-agent",
+}
+
+# command -> step_id -> steps that must be completed first (precomputed once at import)
+_REQUIRED_BEFORE = {
+    command: {step_id: frozenset(sequence[:index]) for index, step_id in enumerate(sequence)}
+    for command, sequence in _STEP_SEQUENCES.items()
+}
+
 
 def now_iso() -> str:
     return datetime.now().isoformat()
 
 
+@lru_cache(maxsize=8)
+def _resolve_project_root_cached(env_root: Optional[str], cwd: str) -> Path:
+    # env_root only participates in the cache key; resolve_project_root reads the env itself.
+    return resolve_project_root(cwd=Path(cwd))
+
+
 def find_project_root() -> Path:
-    """Resolve project root (containing .webnovel/state.json)."""
-    return resolve_project_root()
+    """Resolve project root (containing .webnovel/state.json).
+
+    Cached per (WEBNOVEL_PROJECT_ROOT, cwd) so repeated state/trace writes in one
+    process do not re-walk parent directories. Lookup failures are not cached.
+    """
+    return _resolve_project_root_cached(os.environ.get("WEBNOVEL_PROJECT_ROOT"), os.getcwd())
 
 
 def get_workflow_state_path() -> Path:
@@ -58,6 +94,12 @@ def get_workflow_state_path() -> Path:
     return project_root / ".webnovel" / "workflow_state.json"
 
 
+def get_history_log_path() -> Path:
+    """Append-only NDJSON log of history entries evicted from workflow_state.json."""
+    project_root = find_project_root()
+    return project_root / ".webnovel" / "history.log"
+
+
 def get_call_trace_path() -> Path:
     project_root = find_project_root()
     return project_root / ".webnovel" / "observability" / "call_trace.jsonl"
@@ -91,17 +133,7 @@ def expected_step_owner(command: str, step_id: str) -> str:
     `.claude/references/claude-code-call-matrix.md`.
     """
     if command == "webnovel-write":
-        mapping = {
-            "Step 1": "context-agent",
-            "Step 1.5": "webnovel-write-skill",
-            "Step 2A": "writer-draft",
-            "Step 2B": "style-adapter",
-            "Step 3": "review-agents",
-            "Step 4": "polish-agent",
-            "Step 5": "data-agent",
-            "Step 6": "backup-agent",
-        }
-        return mapping.get(step_id, "webnovel-write-skill")
+        return _WRITE_STEP_OWNERS.get(step_id, "webnovel-write-skill")
 
     if command == "webnovel-review":
         return "webnovel-review-skill"
@@ -111,14 +143,12 @@ def expected_step_owner(command: str, step_id: str) -> str:
 
 def step_allowed_before(command: str, step_id: str, completed_steps: list[Dict[str, Any]]) -> bool:
     """Check simple ordering constraints by pending sequence."""
-    sequence = get_pending_steps(command)
-    if step_id not in sequence:
+    required_before = _REQUIRED_BEFORE.get(command, {}).get(step_id)
+    if required_before is None:
         return True
 
-    expected_index = sequence.index(step_id)
-    completed_ids = [str(item.get("id")) for item in completed_steps]
-    required_before = sequence[:expected_index]
-    return all(prev in completed_ids for prev in required_before)
+    completed_ids = {str(item.get("id")) for item in completed_steps}
+    return required_before.issubset(completed_ids)
 
 
 def _new_task(command: str, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -151,7 +181,7 @@ def _finalize_current_step_as_failed(task: Dict[str, Any], reason: str):
     if current_step.get("status") in {STEP_STATUS_COMPLETED, STEP_STATUS_FAILED}:
         return
 
-    current_step = dict(current_step)
+    # The step is detached from task["current_step"] below, so it is moved rather than copied.
     current_step["status"] = STEP_STATUS_FAILED
     current_step["failed_at"] = now_iso()
     current_step["failure_reason"] = reason
@@ -232,7 +262,7 @@ def start_step(step_id, step_name, progress_note=None):
     }
     task["current_step"]["status"] = STEP_STATUS_RUNNING
     task["status"] = TASK_STATUS_RUNNING
-    task["last_heartbeat"] = now_iso()
+    task["last_heartbeat"] = started_at
 
     save_state(state)
     safe_append_call_trace(
@@ -270,8 +300,9 @@ def complete_step(step_id, artifacts_json=None):
         )
         return
 
+    completed_at = now_iso()
     current_step["status"] = STEP_STATUS_COMPLETED
-    current_step["completed_at"] = now_iso()
+    current_step["completed_at"] = completed_at
 
     if artifacts_json:
         try:
@@ -283,7 +314,7 @@ def complete_step(step_id, artifacts_json=None):
 
     task["completed_steps"].append(current_step)
     task["current_step"] = None
-    task["last_heartbeat"] = now_iso()
+    task["last_heartbeat"] = completed_at
 
     save_state(state)
     safe_append_call_trace(
@@ -318,17 +349,17 @@ def complete_task(final_artifacts_json=None):
             print(f"⚠️ Final artifacts JSON 解析失败: {exc}")
 
     state["last_stable_state"] = extract_stable_state(task)
-    if "history" not in state:
-        state["history"] = []
-    state["history"].append(
+    history = state.setdefault("history", [])
+    history.append(
         {
-            "task_id": f"task_{len(state['history']) + 1:03d}",
+            "task_id": f"task_{_next_history_seq(history):03d}",
             "command": task["command"],
             "chapter": task["args"].get("chapter_num"),
             "status": TASK_STATUS_COMPLETED,
             "completed_at": task["completed_at"],
         }
     )
+    _spill_old_history(history)
 
     state["current_task"] = None
     save_state(state)
@@ -444,8 +475,8 @@ def analyze_recovery_options(interrupt_info):
             }
         ]
 
-        candidate = existing_chapter or draft_path
-        if candidate and candidate.exists():
+        # find_chapter_file only returns existing files; only the draft fallback needs a stat.
+        if existing_chapter is not None or draft_path.exists():
             options.append(
                 {
                     "option": "B",
@@ -554,7 +585,12 @@ def _backup_chapter_for_cleanup(project_root: Path, chapter_num: int, chapter_pa
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_name = f"ch{chapter_num:04d}-{chapter_path.name}.{timestamp}.bak"
     backup_path = backup_dir / backup_name
-    shutil.copy2(chapter_path, backup_path)
+    # The original is unlinked right after, so a hard link keeps the content without copying;
+    # fall back to a copy when linking fails (cross-device, unsupported filesystem).
+    try:
+        os.link(chapter_path, backup_path)
+    except OSError:
+        shutil.copy2(chapter_path, backup_path)
     return backup_path
 
 
@@ -565,13 +601,15 @@ def cleanup_artifacts(chapter_num, *, confirm: bool = False):
 
     project_root = find_project_root()
 
+    # find_chapter_file only returns existing files, and the draft fallback is checked here,
+    # so a non-None chapter_path already exists.
     chapter_path = find_chapter_file(project_root, chapter_num)
     if chapter_path is None:
         draft_path = default_chapter_draft_path(project_root, chapter_num)
         if draft_path.exists():
             chapter_path = draft_path
 
-    if chapter_path and chapter_path.exists():
+    if chapter_path is not None:
         planned_actions.append(f"删除章节文件: {chapter_path.relative_to(project_root)}")
 
     planned_actions.append("重置 Git 暂存区: git reset HEAD .")
@@ -589,7 +627,7 @@ def cleanup_artifacts(chapter_num, *, confirm: bool = False):
         print("⚠️ 检测到高风险清理操作，当前仅预览。若确认执行，请追加 --confirm。")
         return preview_items or ["[预览] 无可清理项"]
 
-    if chapter_path and chapter_path.exists():
+    if chapter_path is not None:
         try:
             backup_path = _backup_chapter_for_cleanup(project_root, chapter_num, chapter_path)
         except OSError as exc:
@@ -604,11 +642,38 @@ def cleanup_artifacts(chapter_num, *, confirm: bool = False):
             )
             return [error_msg]
 
-        chapter_path.unlink()
+        try:
+            chapter_path.unlink()
+        except OSError as exc:
+            # The backup may be a hard link to the still-live chapter; drop it so later in-place
+            # edits to the chapter cannot leak into the "backup".
+            try:
+                backup_path.unlink()
+            except OSError as backup_exc:
+                logger.warning("failed to remove cleanup backup %s: %s", backup_path, backup_exc)
+            error_msg = f"❌ 章节删除失败，已撤销备份: {exc}"
+            safe_append_call_trace(
+                "artifacts_cleanup_delete_failed",
+                {
+                    "chapter": chapter_num,
+                    "chapter_file": str(chapter_path),
+                    "error": str(exc),
+                },
+            )
+            return [error_msg]
+
         artifacts_cleaned.append(str(chapter_path.relative_to(project_root)))
         artifacts_cleaned.append(f"章节备份已保存: {backup_path.relative_to(project_root)}")
 
-    result = subprocess.run(["git", "reset", "HEAD", "."], cwd=project_root, capture_output=True, text=True)
+    # stdout ("Unstaged changes after reset" listing) is never read; only stderr feeds the error message.
+    result = subprocess.run(
+        ["git", "reset", "HEAD", "."],
+        cwd=project_root,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
     if result.returncode == 0:
         artifacts_cleaned.append("Git 暂存区已清理（project）")
     else:
@@ -674,8 +739,7 @@ def load_state():
     state_file = get_workflow_state_path()
     if not state_file.exists():
         return {"current_task": None, "last_stable_state": None, "history": []}
-    with open(state_file, "r", encoding="utf-8") as f:
-        state = json.load(f)
+    state = read_json_file(state_file)
 
     state.setdefault("current_task", None)
     state.setdefault("last_stable_state", None)
@@ -686,6 +750,32 @@ def load_state():
     return state
 
 
+def _next_history_seq(history):
+    """Next task sequence number; continues from the last entry since old entries get spilled."""
+    if history:
+        last_id = str(history[-1].get("task_id", ""))
+        if last_id.startswith("task_") and last_id[5:].isdigit():
+            return int(last_id[5:]) + 1
+    return len(history) + 1
+
+
+def _spill_old_history(history):
+    """Move entries beyond HISTORY_MAX_ENTRIES to the append-only history log (best effort)."""
+    overflow = len(history) - HISTORY_MAX_ENTRIES
+    if overflow <= 0:
+        return
+    log_path = get_history_log_path()
+    try:
+        create_secure_directory(str(log_path.parent))
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in history[:overflow])
+    except OSError as exc:
+        # Keep entries in state rather than lose them.
+        logger.warning("failed to spill workflow history to %s: %s", log_path, exc)
+        return
+    del history[:overflow]
+
+
 def save_state(state):
     """Save workflow state atomically."""
     state_file = get_workflow_state_path()
@@ -695,11 +785,7 @@ def save_state(state):
 
 def get_pending_steps(command):
     """Get command pending step list."""
-    if command == "webnovel-write":
-        return ["Step 1", "Step 1.5", "Step 2A", "Step 2B", "Step 3", "Step 4", "Step 5", "Step 6"]
-    if command == "webnovel-review":
-        return ["Step 1", "Step 2", "Step 3", "Step 4", "Step 5", "Step 6", "Step 7", "Step 8"]
-    return []
+    return list(_STEP_SEQUENCES.get(command, ()))
 
 
 def extract_stable_state(task):